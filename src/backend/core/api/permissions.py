@@ -80,6 +80,31 @@ class IsOwnedOrPublic(IsAuthenticatedWithAnyMethod):
             return False
 
 
+def get_request_operator(request, operator_id):
+    """
+    Return the operator the request is allowed to act for, or None.
+
+    For an external API key, this is the authenticated operator if it is the one
+    requested. For a user, this is the operator if the user has a role on it. User
+    lookups are memoized on the request, so permissions and views checking the same
+    operator during a request only query it once.
+    """
+    if request.auth and isinstance(request.auth, models.Operator):
+        return request.auth if str(request.auth.id) == str(operator_id) else None
+
+    if not request.user or not request.user.is_authenticated:
+        return None
+
+    if not hasattr(request, "role_operators"):
+        request.role_operators = {}
+    key = str(operator_id)
+    if key not in request.role_operators:
+        request.role_operators[key] = models.Operator.objects.filter(
+            id=operator_id, user_roles__user=request.user
+        ).first()
+    return request.role_operators[key]
+
+
 class OperatorAccessPermission(permissions.BasePermission):
     """
     Allows access only to authenticated users with a role in a operators's parent organization.
@@ -94,18 +119,7 @@ class OperatorAccessPermission(permissions.BasePermission):
             return str(operator.id) == str(view.kwargs["operator_id"])
 
         # Regular user authentication
-        if not request.user or not request.user.is_authenticated:
-            return False
-
-        try:
-            operator = models.Operator.objects.get(id=view.kwargs["operator_id"])
-        except models.Operator.DoesNotExist:
-            return False
-
-        has_role = models.UserOperatorRole.objects.filter(
-            operator=operator, user=request.user
-        ).exists()
-        return has_role
+        return get_request_operator(request, view.kwargs["operator_id"]) is not None
 
 
 def user_has_role_in_organization(request, organization_id, operator_id=None):
@@ -126,11 +140,8 @@ def user_has_role_in_organization(request, organization_id, operator_id=None):
         return False
 
     if operator_id:
-        try:
-            operator = models.Operator.objects.get(
-                id=operator_id, user_roles__user=request.user
-            )
-        except models.Operator.DoesNotExist:
+        operator = get_request_operator(request, operator_id)
+        if operator is None:
             return False
 
         # Make sure the organization is managed by the operator
@@ -2,6 +2,8 @@
 
 from collections import defaultdict
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Q
 
 from drf_spectacular.utils import extend_schema_field
@@ -13,6 +15,7 @@ from core.entitlements.resolvers.extended_admin_entitlement_resolver import (
     ExtendedAdminEntitlementResolver,
 )
 from core.services import get_service_handler
+from core.utils import get_organization_not_found_cache_key
 
 
 class IntegerChoicesField(serializers.ChoiceField):
@@ -177,6 +180,21 @@ class SubscriptionCheckResponseSerializer(serializers.Serializer):
         raise NotImplementedError("This serializer is for validation only")
 
 
+# Expected number of digits for each organization identifier, in autodetection order
+_IDENTIFIER_LENGTHS = {"siret": 14, "siren": 9, "insee": 5}
+
+# Organization model field holding each identifier
+_IDENTIFIER_MODEL_FIELDS = {"siret": "siret", "siren": "siren", "insee": "code_insee"}
+
+# Marks an organization not looked up yet, None meaning no identifier was given
+_UNSET = object()
+
+
+def _is_numeric_identifier(value, length):
+    """Check that an identifier is made of exactly `length` digits."""
+    return len(value) == length and value.isdigit()
+
+
 class OrganizationIdentifierSerializer(serializers.Serializer):
     """
     Serializer for organization identifier validation and lookup.
@@ -195,6 +213,10 @@ class OrganizationIdentifierSerializer(serializers.Serializer):
         required=False, allow_blank=True, help_text="INSEE code (5 digits)"
     )
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._organization = _UNSET
+
     def validate(self, attrs):
         """Validate that at most one identifier is provided and has correct format."""
         # Get non-empty identifiers
@@ -217,34 +239,31 @@ class OrganizationIdentifierSerializer(serializers.Serializer):
         identifier_type, identifier_value = next(iter(identifiers.items()))
 
         if identifier_type == "autodetect_id":
-            if len(identifier_value) == 14 and identifier_value.isdigit():
-                identifier_type = "siret"
-            elif len(identifier_value) == 9 and identifier_value.isdigit():
-                identifier_type = "siren"
-            elif len(identifier_value) == 5 and identifier_value.isdigit():
-                identifier_type = "insee"
-            else:
+            identifier_type = next(
+                (
+                    candidate_type
+                    for candidate_type, length in _IDENTIFIER_LENGTHS.items()
+                    if _is_numeric_identifier(identifier_value, length)
+                ),
+                None,
+            )
+            if identifier_type is None:
                 raise serializers.ValidationError(
                     {
                         "autodetect_id": "Invalid ID format. Must be SIRET, SIREN, or INSEE."
                     }
                 )
 
-        if identifier_type == "siret":
-            if not (len(identifier_value) == 14 and identifier_value.isdigit()):
-                raise serializers.ValidationError(
-                    {"siret": "Invalid SIRET format. Must be 14 digits."}
-                )
-        elif identifier_type == "siren":
-            if not (len(identifier_value) == 9 and identifier_value.isdigit()):
-                raise serializers.ValidationError(
-                    {"siren": "Invalid SIREN format. Must be 9 digits."}
-                )
-        elif identifier_type == "insee":
-            if not (len(identifier_value) == 5 and identifier_value.isdigit()):
-                raise serializers.ValidationError(
-                    {"insee": "Invalid INSEE format. Must be 5 digits."}
-                )
+        length = _IDENTIFIER_LENGTHS.get(identifier_type)
+        if length and not _is_numeric_identifier(identifier_value, length):
+            raise serializers.ValidationError(
+                {
+                    identifier_type: (
+                        f"Invalid {identifier_type.upper()} format. "
+                        f"Must be {length} digits."
+                    )
+                }
+            )
 
         # Store the validated identifier info
         attrs["_identifier_type"] = identifier_type
@@ -261,36 +280,46 @@ class OrganizationIdentifierSerializer(serializers.Serializer):
         Raises:
             serializers.ValidationError: If organization is not found
         """
+        # Reuse the organization already fetched for this request, if any
+        if self._organization is not _UNSET:
+            return self._organization
+
         validated_data = self.validated_data
 
         # Check if no identifier was provided (organization-less mode)
         if "_identifier_type" not in validated_data:
+            self._organization = None
             return None
 
         identifier_type = validated_data["_identifier_type"]
         identifier_value = validated_data["_identifier_value"]
 
-        # Look up organization by identifier
-        if identifier_type == "siret":
-            organization = models.Organization.objects.filter(
-                siret=identifier_value
-            ).first()
-        elif identifier_type == "siren":
-            organization = models.Organization.objects.filter(
-                siren=identifier_value
-            ).first()
-        elif identifier_type == "insee":
-            organization = models.Organization.objects.filter(
-                code_insee=identifier_value
-            ).first()
-        else:
+        if identifier_type not in _IDENTIFIER_MODEL_FIELDS:
             raise serializers.ValidationError("Invalid identifier type")
 
+        not_found_error = serializers.ValidationError(
+            f"Organization not found with {identifier_type}: {identifier_value}"
+        )
+
+        # Identifiers recently looked up without success are not looked up again
+        not_found_cache_key = get_organization_not_found_cache_key(
+            identifier_type, identifier_value
+        )
+        if cache.get(not_found_cache_key):
+            raise not_found_error
+
+        # Look up organization by identifier
+        organization = models.Organization.objects.filter(
+            **{_IDENTIFIER_MODEL_FIELDS[identifier_type]: identifier_value}
+        ).first()
+
         if not organization:
-            raise serializers.ValidationError(
-                f"Organization not found with {identifier_type}: {identifier_value}"
+            cache.set(
+                not_found_cache_key, True, settings.ORGANIZATION_NOT_FOUND_CACHE_TIMEOUT
             )
+            raise not_found_error
 
+        self._organization = organization
         return organization
 
     def create(self, validated_data):
@@ -302,15 +331,22 @@ class OrganizationIdentifierSerializer(serializers.Serializer):
         raise NotImplementedError("This serializer is for validation only")
 
 
+# Operator columns read by OperatorSerializer, other columns can be left unfetched
+OPERATOR_SERIALIZED_FIELDS = ["id", "name", "siret", "url", "is_active"]
+
+
 class OperatorSerializer(serializers.ModelSerializer):
     """Serialize operators."""
 
+    # Configuration keys safe to expose, the others may contain sensitive data
+    EXPOSED_CONFIG_KEYS = ["idps", "support_email"]
+
     user_role = serializers.SerializerMethodField(read_only=True)
     config = serializers.SerializerMethodField(read_only=True)
 
     class Meta:
         model = models.Operator
-        fields = ["id", "name", "siret", "url", "is_active", "user_role", "config"]
+        fields = OPERATOR_SERIALIZED_FIELDS + ["user_role", "config"]
         read_only_fields = fields
 
     def get_user_role(self, obj):
@@ -324,10 +360,18 @@ class OperatorSerializer(serializers.ModelSerializer):
         """
         Get the configuration for the operator.
         We don't expose all the configuration, because it may contain sensitive data.
+        Querysets annotated with `exposed_config` already did the filtering in database.
+        The annotation can't tell a missing key from a null one, so null-valued keys
+        are left out on both paths.
         """
-        config = obj.config or {}
-        whitelist_keys = ["idps", "support_email"]
-        return {key: config[key] for key in whitelist_keys if key in config}
+        config = getattr(obj, "exposed_config", None)
+        if config is None:
+            config = obj.config or {}
+        return {
+            key: config[key]
+            for key in self.EXPOSED_CONFIG_KEYS
+            if config.get(key) is not None
+        }
 
 
 class ServiceSerializer(serializers.ModelSerializer):
@@ -821,15 +865,30 @@ class OrganizationServiceSerializer(ServiceSerializer):
 
         return None
 
+    def _get_effective_config(self, obj):
+        """
+        Return the effective configuration of the service for the context operator.
+
+        Reads ``operatorserviceconfig_set`` when it was prefetched, so no query is
+        run per service, and looks the operator service config up otherwise.
+        """
+        operator = self.context.get("operator")
+        if operator is None:
+            return dict(obj.config or {})
+        if "operatorserviceconfig_set" not in getattr(
+            obj, "_prefetched_objects_cache", {}
+        ):
+            return models.OperatorServiceConfig.get_effective_service_config(
+                obj, operator
+            )
+        for config in obj.operatorserviceconfig_set.all():
+            if config.operator_id == operator.id:
+                return config.get_effective_config()
+        return dict(obj.config or {})
+
     def get_config(self, obj):
         """Get the effective configuration for the service, with operator overrides."""
-        operator_id = self.context.get("operator_id")
-        config = models.OperatorServiceConfig.get_effective_service_config(
-            obj,
-            models.Operator.objects.filter(id=operator_id).first()
-            if operator_id
-            else None,
-        )
+        config = self._get_effective_config(obj)
         whitelist_keys = [
             "help_center_url",
             "population_limits",
@@ -842,7 +901,7 @@ class OrganizationServiceSerializer(ServiceSerializer):
         """Return operator configuration for this service."""
 
         configs = obj.operatorserviceconfig_set.all()
-        if configs.count() > 0:
+        if configs:
             return {
                 "display_priority": configs[0].display_priority,
                 "externally_managed": configs[0].externally_managed,
@@ -857,15 +916,11 @@ class OrganizationServiceSerializer(ServiceSerializer):
                 "OrganizationServiceSerializer requires 'organization' in context"
             )
 
-        organization = self.context["organization"]
-        operator = None
-        if "operator_id" in self.context:
-            try:
-                operator = models.Operator.objects.get(id=self.context["operator_id"])
-            except models.Operator.DoesNotExist:
-                pass
-
-        can_activate, reason = instance.can_activate(organization, operator)
+        can_activate, reason = instance.can_activate(
+            self.context["organization"],
+            self.context.get("operator"),
+            effective_config=self._get_effective_config(instance),
+        )
         data["can_activate"] = can_activate
         if not can_activate and reason:
             data["activation_blocked_reason"] = reason
@@ -891,7 +946,8 @@ class AccountSerializer(serializers.ModelSerializer):
         """Aggregate one-row-per-role into dict format grouped by service.
 
         Expects service_links and service_links__service to be prefetched
-        (see OrganizationAccountsViewSet.get_queryset).
+        (see OrganizationAccountsViewSet.get_queryset and
+        AccountViewSet.get_queryset).
         """
         by_service = defaultdict(lambda: {"roles": {}, "service": None})
         for link in obj.service_links.all():
@@ -132,7 +132,7 @@ class AccountViewSet(
 
         def has_object_permission(self, request, view, obj):
             return permissions.request_has_role_in_organization(
-                request, obj.organization.id
+                request, obj.organization_id
             )
 
     authentication_classes = [
@@ -143,6 +143,13 @@ class AccountViewSet(
         AccountPermission,
     ]
 
+    def get_queryset(self):
+        """Prefetch the service links serialized with the retrieved account."""
+        queryset = super().get_queryset()
+        if self.action == "retrieve":
+            queryset = queryset.prefetch_related("service_links__service")
+        return queryset
+
     def perform_update(self, serializer):
         """Set request user context before saving account updates."""
         with request_user_context(self.request.user):
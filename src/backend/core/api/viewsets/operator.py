@@ -2,6 +2,9 @@
 API endpoints for Operator model.
 """
 
+from django.db.models.fields.json import KeyTransform
+from django.db.models.functions import JSONObject
+
 from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -36,12 +39,32 @@ class OperatorViewSet(viewsets.ReadOnlyModelViewSet):
         Superusers can see all operators.
         """
         if self.request.auth and isinstance(self.request.auth, models.Operator):
-            return models.Operator.objects.filter(id=self.request.auth.id)
-        if self.request.user.is_superuser:
-            return models.Operator.objects.all().prefetch_related("user_roles")
-        return models.Operator.objects.filter(
-            user_roles__user=self.request.user
-        ).prefetch_related("user_roles")
+            queryset = models.Operator.objects.filter(id=self.request.auth.id)
+        elif self.request.user.is_superuser:
+            queryset = models.Operator.objects.all()
+        else:
+            queryset = models.Operator.objects.filter(
+                user_roles__user=self.request.user
+            )
+
+        # Nested actions only fetch the operator to check access, nothing to preload
+        if self.action not in ["list", "retrieve"]:
+            return queryset
+
+        # Only fetch the serialized columns and the exposed part of the configuration,
+        # the rest of the configuration may be sensitive
+        return (
+            queryset.prefetch_related("user_roles")
+            .only(*serializers.OPERATOR_SERIALIZED_FIELDS)
+            .annotate(
+                exposed_config=JSONObject(
+                    **{
+                        key: KeyTransform(key, "config")
+                        for key in serializers.OperatorSerializer.EXPOSED_CONFIG_KEYS
+                    }
+                )
+            )
+        )
 
     def get_serializer_class(self):
         return serializers.OperatorSerializer
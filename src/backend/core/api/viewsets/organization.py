@@ -42,9 +42,11 @@ class OperatorOrganizationViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_queryset(self):
         operator_id = self.kwargs["operator_id"]
-        subscriptions_queryset = models.ServiceSubscription.objects.filter(
-            operator=operator_id
-        ).select_related("service", "operator")
+        subscriptions_queryset = (
+            models.ServiceSubscription.objects.filter(operator=operator_id)
+            .select_related("service", "operator")
+            .prefetch_related("entitlements", "operator__user_roles")
+        )
         operator_roles_queryset = models.OperatorOrganizationRole.objects.filter(
             operator_id=operator_id
         )
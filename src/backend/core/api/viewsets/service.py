@@ -103,9 +103,12 @@ class OrganizationServiceViewSet(viewsets.ReadOnlyModelViewSet):
                         organization_id=organization_id,
                     )
                     .exclude(operator_id=operator_id)
-                    .select_related("operator"),
+                    .select_related("operator")
+                    .prefetch_related("entitlements"),
                     to_attr="other_operator_subscription_prefetched",
                 ),
+                # Counted by Service.can_activate for each service
+                "required_services",
             )
             .prefetch_related("subscriptions__entitlements")
             .distinct()
@@ -113,9 +116,13 @@ class OrganizationServiceViewSet(viewsets.ReadOnlyModelViewSet):
         )
 
     def get_serializer_context(self):
-        """Add operator_id and organization to serializer context."""
+        """Add operator_id, operator and organization to serializer context."""
         context = super().get_serializer_context()
         context["operator_id"] = self.kwargs["operator_id"]
+        # Already looked up when checking permissions
+        context["operator"] = permissions.get_request_operator(
+            self.request, self.kwargs["operator_id"]
+        )
         try:
             organization = models.Organization.objects.get(
                 id=self.kwargs["organization_id"]
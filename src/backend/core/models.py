@@ -921,10 +921,18 @@ class Service(BaseModel):
             return f"{settings.API_PUBLIC_URL}servicelogo/{self.id}/"
         return None
 
-    def can_activate(self, organization: Organization, operator: "Operator" = None):
+    def can_activate(
+        self,
+        organization: Organization,
+        operator: "Operator" = None,
+        effective_config: dict | None = None,
+    ):
         """
         Check if the service can be activated for the given organization.
 
+        The effective config of the service for the operator is looked up unless
+        the caller already has it and passes it as ``effective_config``.
+
         Returns:
             tuple: (can_activate: bool, reason: str | None)
         """
@@ -944,9 +952,10 @@ class Service(BaseModel):
                 return (False, "missing_required_services")
 
         # Check population limits
-        effective_config = OperatorServiceConfig.get_effective_service_config(
-            self, operator
-        )
+        if effective_config is None:
+            effective_config = OperatorServiceConfig.get_effective_service_config(
+                self, operator
+            )
         population_limits = effective_config.get("population_limits", {})
         if not population_limits:
             return (True, None)
@@ -8,11 +8,15 @@ from contextvars import ContextVar
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from core.models import Account, AccountServiceLink, ServiceSubscription
+from core.models import Account, AccountServiceLink, Organization, ServiceSubscription
+from core.utils import forget_organizations_not_found
 from core.webhooks import WebhookClient
 
 logger = logging.getLogger(__name__)
 
+# Organization fields looked up by OrganizationIdentifierSerializer
+ORGANIZATION_IDENTIFIERS = {"siret", "siren", "code_insee"}
+
 # Context variable for request user (works in sync and async contexts)
 _request_user: ContextVar = ContextVar("request_user", default=None)
 
@@ -57,6 +61,14 @@ def _mask_email(email):
     return f"{local[0]}***@{domain}"
 
 
+@receiver(post_save, sender=Organization)
+def handle_organization_save(sender, instance, update_fields=None, **kwargs):
+    """Forget identifier lookups that failed before this organization was saved."""
+    if update_fields is not None and not update_fields & ORGANIZATION_IDENTIFIERS:
+        return
+    forget_organizations_not_found([instance])
+
+
 @receiver(post_save, sender=ServiceSubscription)
 def handle_subscription_save(sender, instance, created, **kwargs):
     """
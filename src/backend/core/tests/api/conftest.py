@@ -1,6 +1,10 @@
 """Fixtures for tests in the deploycenter core api application"""
 # pylint: disable=redefined-outer-name
 
+from contextlib import contextmanager
+
+from django.db import transaction
+
 import pytest
 from rest_framework.test import APIClient
 
@@ -13,8 +17,39 @@ def other_user():
     return factories.UserFactory()
 
 
-# Add an api_client fixture
 @pytest.fixture
-def api_client():
-    """Provide an instance of the API client for tests."""
+def anon_client():
+    """Provide an anonymous instance of the API client for tests."""
     return APIClient()
+
+
+@pytest.fixture
+def auth_client(anon_client):
+    """Provide a function authenticating the API client as a given user."""
+
+    def _auth_client(user):
+        anon_client.force_authenticate(user=user)
+        return anon_client
+
+    return _auth_client
+
+
+@pytest.fixture(name="module_db", scope="session")
+def fixture_module_db(request, django_db_blocker):
+    """
+    Provide a context manager for module-scoped fixtures creating database rows
+    shared by all the tests of a module.
+
+    The rows are created in a transaction rolled back once the fixture is torn
+    down, after the last test of the module. Each test runs in a nested savepoint,
+    so what it creates is still rolled back at the end of the test.
+    """
+    request.getfixturevalue("django_db_setup")
+
+    @contextmanager
+    def _module_db():
+        with django_db_blocker.unblock(), transaction.atomic():
+            yield
+            transaction.set_rollback(True)
+
+    return _module_db
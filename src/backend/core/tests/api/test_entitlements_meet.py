@@ -10,6 +10,7 @@ from core import factories
 from core.entitlements.resolvers.meet_access_entitlement_resolver import (
     MeetAccessEntitlementResolver,
 )
+from core.tests.utils import expected_operator_dict
 
 pytestmark = pytest.mark.django_db
 
@@ -58,13 +59,7 @@ def test_api_entitlements_meet_can_create_with_active_subscription():
             "name": organization.name,
             "oidc_valid": None,
         },
-        "operator": {
-            "id": str(operator.id),
-            "name": operator.name,
-            "siret": operator.siret,
-            "url": operator.url,
-            "config": {},
-        },
+        "operator": expected_operator_dict(operator, with_role=False),
         "entitlements": {
             "can_create": True,
         },
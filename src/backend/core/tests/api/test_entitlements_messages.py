@@ -9,6 +9,7 @@ from responses import matchers
 from rest_framework.test import APIClient
 
 from core import factories, models
+from core.tests.utils import expected_operator_dict
 
 pytestmark = pytest.mark.django_db
 
@@ -152,13 +153,7 @@ def test_api_entitlements_mailbox_can_store(
             "name": organization.name,
             "oidc_valid": None,
         },
-        "operator": {
-            "id": str(operator.id),
-            "name": operator.name,
-            "siret": operator.siret,
-            "url": operator.url,
-            "config": {},
-        },
+        "operator": expected_operator_dict(operator, with_role=False),
         "entitlements": {
             "can_access": True,
             "can_store": True,
@@ -229,13 +224,7 @@ def test_api_entitlements_mailbox_can_store(
             "name": organization.name,
             "oidc_valid": None,
         },
-        "operator": {
-            "id": str(operator.id),
-            "name": operator.name,
-            "siret": operator.siret,
-            "url": operator.url,
-            "config": {},
-        },
+        "operator": expected_operator_dict(operator, with_role=False),
         "entitlements": {
             "can_access": True,
             "can_store": False,
@@ -424,13 +413,7 @@ def test_api_entitlements_organization_can_store(
             "name": organization.name,
             "oidc_valid": None,
         },
-        "operator": {
-            "id": str(operator.id),
-            "name": operator.name,
-            "siret": operator.siret,
-            "url": operator.url,
-            "config": {},
-        },
+        "operator": expected_operator_dict(operator, with_role=False),
         "entitlements": {
             "can_access": True,
             "can_store": can_store,
@@ -636,13 +619,7 @@ def test_api_entitlements_mailbox_override_can_store(
             "name": organization.name,
             "oidc_valid": None,
         },
-        "operator": {
-            "id": str(operator.id),
-            "name": operator.name,
-            "siret": operator.siret,
-            "url": operator.url,
-            "config": {},
-        },
+        "operator": expected_operator_dict(operator, with_role=False),
         "entitlements": {
             "can_access": True,
             "can_store": can_store_before_override,
@@ -689,13 +666,7 @@ def test_api_entitlements_mailbox_override_can_store(
             "name": organization.name,
             "oidc_valid": None,
         },
-        "operator": {
-            "id": str(operator.id),
-            "name": operator.name,
-            "siret": operator.siret,
-            "url": operator.url,
-            "config": {},
-        },
+        "operator": expected_operator_dict(operator, with_role=False),
         "entitlements": {
             "can_access": True,
             "can_store": can_store,
@@ -795,13 +766,7 @@ def test_api_entitlements_mailbox_override_can_store(
             "name": organization.name,
             "oidc_valid": None,
         },
-        "operator": {
-            "id": str(operator.id),
-            "name": operator.name,
-            "siret": operator.siret,
-            "url": operator.url,
-            "config": {},
-        },
+        "operator": expected_operator_dict(operator, with_role=False),
         "entitlements": {
             "can_access": True,
             "can_store": can_store_before_override,
@@ -926,13 +891,7 @@ def test_api_entitlements_list_unlimited_storage(
             "name": organization.name,
             "oidc_valid": None,
         },
-        "operator": {
-            "id": str(operator.id),
-            "name": operator.name,
-            "siret": operator.siret,
-            "url": operator.url,
-            "config": {},
-        },
+        "operator": expected_operator_dict(operator, with_role=False),
         "entitlements": {
             "can_access": True,
             "can_store": True,
@@ -14,7 +14,7 @@ pytestmark = pytest.mark.django_db
 class TestLagaufreServicesEndpoint:
     """Test the Lagaufre services endpoint."""
 
-    def test_get_services_with_siret_success(self, api_client):
+    def test_get_services_with_siret_success(self, anon_client):
         """Test successful retrieval of services with SIRET."""
         # Create test data
         organization = factories.OrganizationFactory()
@@ -56,7 +56,7 @@ class TestLagaufreServicesEndpoint:
         # No authentication required for anonymous API
 
         # Test request
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"siret": organization.siret, "operator": operator.id},
         )
@@ -90,7 +90,7 @@ class TestLagaufreServicesEndpoint:
             assert "subscribed" in service_data
             assert isinstance(service_data["subscribed"], bool)
 
-    def test_get_services_with_siren_success(self, api_client):
+    def test_get_services_with_siren_success(self, anon_client):
         """Test successful retrieval of services with SIREN."""
         operator = factories.OperatorFactory()
         # Create test data
@@ -104,7 +104,7 @@ class TestLagaufreServicesEndpoint:
         # No authentication required for anonymous API
 
         # Test request
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"siren": organization.siren, "operator": operator.id},
         )
@@ -116,7 +116,7 @@ class TestLagaufreServicesEndpoint:
         assert len(data["services"]) == 1
         assert data["services"][0]["subscribed"] is True
 
-    def test_get_services_with_insee_success(self, api_client):
+    def test_get_services_with_insee_success(self, anon_client):
         """Test successful retrieval of services with INSEE code."""
         operator = factories.OperatorFactory()
         # Create test data
@@ -130,7 +130,7 @@ class TestLagaufreServicesEndpoint:
         # No authentication required for anonymous API
 
         # Test request
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"insee": organization.code_insee, "operator": operator.id},
         )
@@ -142,7 +142,7 @@ class TestLagaufreServicesEndpoint:
         assert len(data["services"]) == 1
         assert data["services"][0]["subscribed"] is True
 
-    def test_get_services_no_subscriptions(self, api_client):
+    def test_get_services_no_subscriptions(self, anon_client):
         """Test retrieval when organization has no subscriptions."""
         operator = factories.OperatorFactory()
         # Create test data
@@ -153,7 +153,7 @@ class TestLagaufreServicesEndpoint:
         # No authentication required for anonymous API
 
         # Test request
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"siret": organization.siret, "operator": operator.id},
         )
@@ -164,7 +164,7 @@ class TestLagaufreServicesEndpoint:
         assert len(data["services"]) == 1
         assert data["services"][0]["subscribed"] is False
 
-    def test_get_services_only_active_services(self, api_client):
+    def test_get_services_only_active_services(self, anon_client):
         """Test that only active services are returned."""
         # Create test data
         organization = factories.OrganizationFactory()
@@ -189,7 +189,7 @@ class TestLagaufreServicesEndpoint:
         # No authentication required for anonymous API
 
         # Test request
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"siret": organization.siret, "operator": operator.id},
         )
@@ -201,7 +201,7 @@ class TestLagaufreServicesEndpoint:
         assert len(data["services"]) == 1
         assert data["services"][0]["id"] == active_service.id
 
-    def test_get_services_logo_url_generation(self, api_client):
+    def test_get_services_logo_url_generation(self, anon_client):
         """Test that logo URLs are properly generated."""
         # Create test data
         organization = factories.OrganizationFactory()
@@ -225,7 +225,7 @@ class TestLagaufreServicesEndpoint:
         # No authentication required for anonymous API
 
         # Test request
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"siret": organization.siret, "operator": operator.id},
         )
@@ -248,7 +248,7 @@ class TestLagaufreServicesEndpoint:
         )
         assert service_without_logo_data["logo"] is None
 
-    def test_get_services_organization_not_found(self, api_client):
+    def test_get_services_organization_not_found(self, anon_client):
         """Test 404 when organization doesn't exist."""
         # Create test data
         operator = factories.OperatorFactory()
@@ -256,7 +256,7 @@ class TestLagaufreServicesEndpoint:
         # No authentication required for anonymous API
 
         # Test request with non-existent SIRET
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"siret": "99999999999999", "operator": operator.id},
         )
@@ -267,7 +267,7 @@ class TestLagaufreServicesEndpoint:
         assert "Organization not found" in data["error"]
         assert data["services"] == []
 
-    def test_get_services_invalid_siret_format(self, api_client):
+    def test_get_services_invalid_siret_format(self, anon_client):
         """Test 400 with invalid SIRET format."""
         # Create test data
         operator = factories.OperatorFactory()
@@ -275,7 +275,7 @@ class TestLagaufreServicesEndpoint:
         # No authentication required for anonymous API
 
         # Test request with invalid SIRET format
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"siret": "12345", "operator": operator.id},  # Too short
         )
@@ -287,7 +287,7 @@ class TestLagaufreServicesEndpoint:
         assert "Invalid SIRET format" in data["error"]["siret"][0]
         assert data["services"] == []
 
-    def test_get_services_invalid_siren_format(self, api_client):
+    def test_get_services_invalid_siren_format(self, anon_client):
         """Test 400 with invalid SIREN format."""
         # Create test data
         operator = factories.OperatorFactory()
@@ -295,7 +295,7 @@ class TestLagaufreServicesEndpoint:
         # No authentication required for anonymous API
 
         # Test request with invalid SIREN format
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"siren": "123", "operator": operator.id},  # Too short
         )
@@ -307,7 +307,7 @@ class TestLagaufreServicesEndpoint:
         assert "Invalid SIREN format" in data["error"]["siren"][0]
         assert data["services"] == []
 
-    def test_get_services_invalid_insee_format(self, api_client):
+    def test_get_services_invalid_insee_format(self, anon_client):
         """Test 400 with invalid INSEE format."""
         # Create test data
         operator = factories.OperatorFactory()
@@ -315,7 +315,7 @@ class TestLagaufreServicesEndpoint:
         # No authentication required for anonymous API
 
         # Test request with invalid INSEE format
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"insee": "123", "operator": operator.id},  # Too short
         )
@@ -327,7 +327,7 @@ class TestLagaufreServicesEndpoint:
         assert "Invalid INSEE format" in data["error"]["insee"][0]
         assert data["services"] == []
 
-    def test_get_services_multiple_identifiers(self, api_client):
+    def test_get_services_multiple_identifiers(self, anon_client):
         """Test 400 when multiple identifiers are provided."""
         # Create test data
         operator = factories.OperatorFactory()
@@ -335,7 +335,7 @@ class TestLagaufreServicesEndpoint:
         # No authentication required for anonymous API
 
         # Test request with multiple identifiers
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"siret": "12345678901234", "siren": "123456789", "operator": operator.id},
         )
@@ -350,7 +350,7 @@ class TestLagaufreServicesEndpoint:
         )
         assert data["services"] == []
 
-    def test_get_services_no_identifiers(self, api_client):
+    def test_get_services_no_identifiers(self, anon_client):
         """Test organization-less mode when no identifiers are provided."""
         # Create test data
         operator = factories.OperatorFactory()
@@ -360,7 +360,7 @@ class TestLagaufreServicesEndpoint:
         # No authentication required for anonymous API
 
         # Test request with no identifiers (organization-less mode)
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"operator": operator.id},
         )
@@ -373,7 +373,7 @@ class TestLagaufreServicesEndpoint:
         assert len(data["services"]) == 1
         assert "subscribed" not in data["services"][0]
 
-    def test_get_services_anonymous_access(self, api_client):
+    def test_get_services_anonymous_access(self, anon_client):
         """Test that anonymous users can access the API."""
         # Create test data
         operator = factories.OperatorFactory()
@@ -385,7 +385,7 @@ class TestLagaufreServicesEndpoint:
         factories.OperatorServiceConfigFactory(operator=operator, service=service)
 
         # Test request without authentication (should work now)
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"siret": organization.siret, "operator": operator.id},
         )
@@ -395,7 +395,7 @@ class TestLagaufreServicesEndpoint:
         assert len(data["services"]) == 1
         assert data["services"][0]["subscribed"] is True
 
-    def test_get_services_empty_string_identifiers(self, api_client):
+    def test_get_services_empty_string_identifiers(self, anon_client):
         """Test organization-less mode with empty string identifiers."""
         # Create test data
         operator = factories.OperatorFactory()
@@ -405,7 +405,7 @@ class TestLagaufreServicesEndpoint:
         # No authentication required for anonymous API
 
         # Test request with empty string identifiers (should work in organization-less mode)
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"siret": "", "siren": "", "insee": "", "operator": operator.id},
         )
@@ -418,7 +418,7 @@ class TestLagaufreServicesEndpoint:
         assert len(data["services"]) == 1
         assert "subscribed" not in data["services"][0]
 
-    def test_get_services_whitespace_identifiers(self, api_client):
+    def test_get_services_whitespace_identifiers(self, anon_client):
         """Test that whitespace in identifiers is handled correctly."""
         # Create test data
         organization = factories.OrganizationFactory()
@@ -429,7 +429,7 @@ class TestLagaufreServicesEndpoint:
         # No authentication required for anonymous API
 
         # Test request with whitespace around SIRET
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"siret": f"  {organization.siret}  ", "operator": operator.id},
         )
@@ -440,7 +440,7 @@ class TestLagaufreServicesEndpoint:
         assert data["organization"]["siret"] == organization.siret
         assert len(data["services"]) == 1
 
-    def test_get_services_ordering_by_subscription_status(self, api_client):
+    def test_get_services_ordering_by_subscription_status(self, anon_client):
         """Test that services are properly ordered by subscription status."""
         # Create test data
         organization = factories.OrganizationFactory()
@@ -477,7 +477,7 @@ class TestLagaufreServicesEndpoint:
         # No authentication required for anonymous API
 
         # Test request
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"siret": organization.siret, "operator": operator.id},
         )
@@ -502,7 +502,7 @@ class TestLagaufreServicesEndpoint:
             else:
                 assert service_data["subscribed"] is False
 
-    def test_get_services_organization_less_mode(self, api_client):
+    def test_get_services_organization_less_mode(self, anon_client):
         """Test organization-less mode returns all services without subscription info."""
         # Create test data
         operator = factories.OperatorFactory()
@@ -535,7 +535,7 @@ class TestLagaufreServicesEndpoint:
         # No authentication required for anonymous API
 
         # Test request with no organization identifier but with deploycenter
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"operator": operator.id},
         )
@@ -568,33 +568,33 @@ class TestLagaufreServicesEndpoint:
         service_names = [s["name"] for s in services]
         assert "Inactive Service" not in service_names
 
-    def test_get_services_missing_operator_parameter(self, api_client):
+    def test_get_services_missing_operator_parameter(self, anon_client):
         """Test that missing operator parameter returns 400 error."""
         # Create test data
         organization = factories.OrganizationFactory()
 
         # Test request without operator parameter
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"siret": organization.siret},
         )
 
         assert response.status_code == 400
 
-    def test_get_services_invalid_operator_id(self, api_client):
+    def test_get_services_invalid_operator_id(self, anon_client):
         """Test that invalid operator ID returns 400 error."""
         # Create test data
         organization = factories.OrganizationFactory()
 
         # Test request with invalid operator ID
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"siret": organization.siret, "operator": "invalid-uuid"},
         )
 
         assert response.status_code == 400
 
-    def test_get_services_organization_less_mode_with_empty_strings(self, api_client):
+    def test_get_services_organization_less_mode_with_empty_strings(self, anon_client):
         """Test organization-less mode with empty string identifiers."""
         # Create test data
         operator = factories.OperatorFactory()
@@ -604,7 +604,7 @@ class TestLagaufreServicesEndpoint:
         # No authentication required for anonymous API
 
         # Test request with empty string identifiers
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"siret": "", "siren": "", "insee": "", "operator": operator.id},
         )
@@ -617,7 +617,7 @@ class TestLagaufreServicesEndpoint:
         assert len(data["services"]) == 1
         assert "subscribed" not in data["services"][0]
 
-    def test_get_services_organization_less_mode_with_whitespace(self, api_client):
+    def test_get_services_organization_less_mode_with_whitespace(self, anon_client):
         """Test organization-less mode with whitespace-only identifiers."""
         # Create test data
         operator = factories.OperatorFactory()
@@ -627,7 +627,7 @@ class TestLagaufreServicesEndpoint:
         # No authentication required for anonymous API
 
         # Test request with whitespace-only identifiers
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"siret": "   ", "siren": "  ", "insee": " ", "operator": operator.id},
         )
@@ -640,7 +640,7 @@ class TestLagaufreServicesEndpoint:
         assert len(data["services"]) == 1
         assert "subscribed" not in data["services"][0]
 
-    def test_get_services_only_matches_operator_specific_config(self, api_client):
+    def test_get_services_only_matches_operator_specific_config(self, anon_client):
         """
         Test that display_priority filter only matches the OperatorServiceConfig
         for the specified operator, not configs from other operators.
@@ -669,7 +669,7 @@ class TestLagaufreServicesEndpoint:
 
         # Query for operator1's services
         # The service should NOT be returned because operator1's config has priority < 0
-        response = api_client.get(
+        response = anon_client.get(
             "/api/v1.0/lagaufre/services/",
             {"operator": operator1.id},
         )
@@ -3,59 +3,48 @@ Test users API endpoints in the deploycenter core app.
 """
 
 import pytest
-from rest_framework.test import APIClient
 
 from core import factories
+from core.api.serializers import OperatorSerializer
+from core.tests.utils import expected_operator_dict
 
 pytestmark = pytest.mark.django_db
 
 
-def test_api_operators_list_anonymous():
+def test_api_operators_list_anonymous(anon_client):
     """Anonymous users should not be allowed to list operators."""
     factories.UserFactory.create_batch(2)
-    client = APIClient()
-    response = client.get("/api/v1.0/operators/")
+    response = anon_client.get("/api/v1.0/operators/")
     assert response.status_code == 401
     assert response.json() == {
         "detail": "Informations d'authentification non fournies."
     }
 
 
-def test_api_operators_list_authenticated():
+def test_api_operators_list_authenticated(django_assert_num_queries, auth_client):
     """Authenticated users should be able to list operators for which they have a UserOperatorRole."""
     user = factories.UserFactory()
     user2 = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
+    client = auth_client(user)
     operator = factories.OperatorFactory()
     operator2 = factories.OperatorFactory()
     operator3 = factories.OperatorFactory()
     factories.UserOperatorRoleFactory(user=user, operator=operator)
     factories.UserOperatorRoleFactory(user=user2, operator=operator2)
     factories.UserOperatorRoleFactory(user=user2, operator=operator3)
-    response = client.get("/api/v1.0/operators/")
+    with django_assert_num_queries(3):
+        response = client.get("/api/v1.0/operators/")
     content = response.json()
     results = content["results"]
     assert len(results) == 1
-    assert results == [
-        {
-            "id": str(operator.id),
-            "name": operator.name,
-            "siret": operator.siret,
-            "url": operator.url,
-            "is_active": operator.is_active,
-            "user_role": "admin",
-            "config": operator.config,
-        }
-    ]
-
-
-def test_api_operators_retrieve_authenticated():
+    assert results == [expected_operator_dict(operator)]
+
+
+def test_api_operators_retrieve_authenticated(auth_client):
     """Authenticated users should be able to retrieve operators for which they have a UserOperatorRole."""
     user = factories.UserFactory()
     user2 = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
+    client = auth_client(user)
     operator = factories.OperatorFactory()
     operator2 = factories.OperatorFactory()
     operator3 = factories.OperatorFactory()
@@ -64,24 +53,14 @@ def test_api_operators_retrieve_authenticated():
     factories.UserOperatorRoleFactory(user=user2, operator=operator3)
     response = client.get(f"/api/v1.0/operators/{operator.id}/")
     content = response.json()
-    results = content
-    assert results == {
-        "id": str(operator.id),
-        "name": operator.name,
-        "siret": operator.siret,
-        "url": operator.url,
-        "is_active": operator.is_active,
-        "user_role": "admin",
-        "config": operator.config,
-    }
+    assert content == expected_operator_dict(operator)
 
 
-def test_api_operators_retrieve_authenticated_no_role():
+def test_api_operators_retrieve_authenticated_no_role(auth_client):
     """Authenticated users should not be able to retrieve operators for which they have no UserOperatorRole."""
     user = factories.UserFactory()
     user2 = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
+    client = auth_client(user)
     operator = factories.OperatorFactory()
     operator2 = factories.OperatorFactory()
     operator3 = factories.OperatorFactory()
@@ -93,11 +72,10 @@ def test_api_operators_retrieve_authenticated_no_role():
     assert response.json() == {"detail": "No Operator matches the given query."}
 
 
-def test_api_operators_services_no_role():
+def test_api_operators_services_no_role(auth_client):
     """Users should not be able to list services for an operator they have no role on."""
     user = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
+    client = auth_client(user)
 
     operator = factories.OperatorFactory()
     other_operator = factories.OperatorFactory()
@@ -110,11 +88,10 @@ def test_api_operators_services_no_role():
     assert response.status_code == 404
 
 
-def test_api_operators_services_with_role():
+def test_api_operators_services_with_role(auth_client, django_assert_num_queries):
     """Users should be able to list services for an operator they have a role on."""
     user = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
+    client = auth_client(user)
 
     operator = factories.OperatorFactory()
     factories.UserOperatorRoleFactory(user=user, operator=operator)
@@ -122,18 +99,18 @@ def test_api_operators_services_with_role():
     service = factories.ServiceFactory(is_active=True)
     factories.OperatorServiceConfigFactory(operator=operator, service=service)
 
-    response = client.get(f"/api/v1.0/operators/{operator.id}/services/")
+    with django_assert_num_queries(2):
+        response = client.get(f"/api/v1.0/operators/{operator.id}/services/")
     assert response.status_code == 200
     results = response.json()["results"]
     assert len(results) == 1
     assert results[0]["id"] == service.id
 
 
-def test_api_operators_list_superuser():
+def test_api_operators_list_superuser(auth_client):
     """Superusers should be able to list all operators regardless of roles."""
     user = factories.UserFactory(is_superuser=True)
-    client = APIClient()
-    client.force_login(user)
+    client = auth_client(user)
 
     operator1 = factories.OperatorFactory()
     operator2 = factories.OperatorFactory()
@@ -147,11 +124,10 @@ def test_api_operators_list_superuser():
     assert returned_ids == {str(operator1.id), str(operator2.id), str(operator3.id)}
 
 
-def test_api_operators_retrieve_superuser():
+def test_api_operators_retrieve_superuser(auth_client):
     """Superusers should be able to retrieve any operator regardless of roles."""
     user = factories.UserFactory(is_superuser=True)
-    client = APIClient()
-    client.force_login(user)
+    client = auth_client(user)
 
     operator = factories.OperatorFactory()
 
@@ -160,11 +136,10 @@ def test_api_operators_retrieve_superuser():
     assert response.json()["id"] == str(operator.id)
 
 
-def test_api_operators_exposed_config():
+def test_api_operators_exposed_config(auth_client):
     """Test that the exposed config is the expected one."""
     user = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
+    client = auth_client(user)
 
     operator = factories.OperatorFactory(
         config={"idps": ["idp1", "idp2"], "secret_key": "secret_key"}
@@ -187,11 +162,57 @@ def test_api_operators_exposed_config():
     assert keys == ["idps"]
 
 
-def test_api_operators_list_superuser_page_size():
+def test_api_operators_exposed_config_null_value(auth_client):
+    """Null-valued exposed keys should be left out, whether annotated or not."""
+    user = factories.UserFactory()
+    client = auth_client(user)
+
+    operator = factories.OperatorFactory(
+        config={"idps": ["idp1"], "support_email": None, "secret_key": "secret_key"}
+    )
+    factories.UserOperatorRoleFactory(user=user, operator=operator)
+
+    # Retrieve route, reading the annotated config.
+    response = client.get(f"/api/v1.0/operators/{operator.id}/")
+    assert response.status_code == 200
+    assert response.json()["config"] == {"idps": ["idp1"]}
+
+    # List route, reading the annotated config.
+    response = client.get("/api/v1.0/operators/")
+    assert response.json()["results"][0]["config"] == {"idps": ["idp1"]}
+
+    # Unannotated instance, as nested in other payloads.
+    assert OperatorSerializer(operator).data["config"] == {"idps": ["idp1"]}
+
+
+def test_api_operators_list_only_fetches_exposed_columns(
+    auth_client, django_assert_num_queries
+):
+    """Sensitive operator columns should not even be fetched from the database."""
+    user = factories.UserFactory()
+    client = auth_client(user)
+
+    operator = factories.OperatorFactory(
+        config={"idps": ["idp1"], "secret_key": "secret_key"},
+        external_management_api_key="external-key",
+    )
+    factories.UserOperatorRoleFactory(user=user, operator=operator)
+
+    with django_assert_num_queries(3) as captured:
+        response = client.get("/api/v1.0/operators/")
+    assert response.status_code == 200
+
+    # Queries are: count, operators, prefetched user roles
+    operator_query = captured.captured_queries[1]["sql"]
+    assert '"deploycenter_operator"."name"' in operator_query
+    assert "external_management_api_key" not in operator_query
+    assert "name_with_article" not in operator_query
+
+
+def test_api_operators_list_superuser_page_size(auth_client):
     """Superusers should be able to list all operators using page_size parameter."""
     user = factories.UserFactory(is_superuser=True)
-    client = APIClient()
-    client.force_login(user)
+    client = auth_client(user)
 
     factories.OperatorFactory.create_batch(25)
 
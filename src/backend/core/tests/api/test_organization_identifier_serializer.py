@@ -2,10 +2,14 @@
 Test OrganizationIdentifierSerializer in the deploycenter core app.
 """
 
+from django.core.cache import cache
+
 import pytest
 
 from core import factories
 from core.api.serializers import OrganizationIdentifierSerializer
+from core.tests.utils import create_operator_organizations
+from core.utils import get_organization_not_found_cache_key
 
 pytestmark = pytest.mark.django_db
 
@@ -55,6 +59,19 @@ class TestOrganizationIdentifierSerializer:
         assert serializer.validated_data["_identifier_type"] == "insee"
         assert serializer.validated_data["_identifier_value"] == organization.code_insee
 
+    def test_get_organization_is_cached(self, django_assert_num_queries):
+        """Test that the organization is only fetched once per serializer."""
+        organization = factories.OrganizationFactory()
+
+        serializer = OrganizationIdentifierSerializer(
+            data={"siret": organization.siret}
+        )
+        assert serializer.is_valid()
+
+        with django_assert_num_queries(1):
+            assert serializer.get_organization() == organization
+            assert serializer.get_organization() == organization
+
     def test_invalid_siret_format(self):
         """Test serializer with invalid SIRET format."""
         serializer = OrganizationIdentifierSerializer(data={"siret": "12345"})
@@ -136,3 +153,49 @@ class TestOrganizationIdentifierSerializer:
             serializer.get_organization()
 
         assert "Organization not found" in str(exc_info.value)
+
+    def test_organization_not_found_is_cached(self, django_assert_num_queries):
+        """Test that a failed lookup is not repeated until an organization is saved."""
+        with django_assert_num_queries(1):
+            for _ in range(2):
+                serializer = OrganizationIdentifierSerializer(
+                    data={"siren": "999999999"}
+                )
+                assert serializer.is_valid()
+                with pytest.raises(Exception) as exc_info:
+                    serializer.get_organization()
+                assert "Organization not found" in str(exc_info.value)
+
+        organization = factories.OrganizationFactory(siren="999999999")
+
+        serializer = OrganizationIdentifierSerializer(data={"siren": "999999999"})
+        assert serializer.is_valid()
+        assert serializer.get_organization() == organization
+
+    def test_organization_not_found_forgotten_after_bulk_create(self):
+        """Test that bulk-created organizations are found despite a cached failure."""
+        serializer = OrganizationIdentifierSerializer(data={"siret": "99999999999999"})
+        assert serializer.is_valid()
+        with pytest.raises(Exception) as exc_info:
+            serializer.get_organization()
+        assert "Organization not found" in str(exc_info.value)
+
+        [organization] = create_operator_organizations(
+            factories.OperatorFactory(), {"siret": "99999999999999"}
+        )
+
+        serializer = OrganizationIdentifierSerializer(data={"siret": "99999999999999"})
+        assert serializer.is_valid()
+        assert serializer.get_organization() == organization
+
+    def test_organization_not_found_kept_on_unrelated_save(self):
+        """Test that saving fields other than identifiers keeps cached failures."""
+        organization = factories.OrganizationFactory(siren="999999999")
+        cache_key = get_organization_not_found_cache_key("siren", "999999999")
+        cache.set(cache_key, True)
+
+        organization.save(update_fields=["name"])
+        assert cache.get(cache_key)
+
+        organization.save(update_fields=["name", "siren"])
+        assert cache.get(cache_key) is None
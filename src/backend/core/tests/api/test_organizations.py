@@ -2,68 +2,94 @@
 Test users API endpoints in the deploycenter core app.
 """
 
+from dataclasses import dataclass
+
 import pytest
-from rest_framework.test import APIClient
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
 
-from core import factories
-from core.models import Organization
-from core.tests.utils import assert_equals_partial
+from core import factories, models
+from core.api.viewsets.organization import OperatorOrganizationViewSet
+from core.tests.utils import (
+    assert_equals_partial,
+    assert_items_match,
+    create_operator_organizations,
+)
 
 pytestmark = pytest.mark.django_db
 
 
-def test_api_organizations_list_anonymous():
-    """Anonymous users should not be allowed to list operators."""
-    factories.UserFactory.create_batch(2)
-    client = APIClient()
+@dataclass
+class OperatorsSetup:
+    """Handles on the user and operators shared by the tests of this module."""
+
+    user: models.User
+    client: APIClient
+    operator: models.Operator
+    operator2: models.Operator
+
+
+@pytest.fixture(name="operators_data", scope="module")
+def fixture_operators_data(module_db):
+    """
+    Create a user with a role on an operator, and another operator the user has
+    no role on, once for the whole module.
+    """
+    with module_db():
+        user = factories.UserFactory()
+        operator = factories.OperatorFactory()
+        operator2 = factories.OperatorFactory()
+        factories.UserOperatorRoleFactory(user=user, operator=operator)
+        yield user, operator, operator2
+
 
-    operator = factories.OperatorFactory()
-    organization = factories.OrganizationFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization
+@pytest.fixture(name="operators_setup")
+def fixture_operators_setup(operators_data, auth_client):
+    """Provide the module operators and a client authenticated as their user."""
+    user, operator, operator2 = operators_data
+    return OperatorsSetup(
+        user=user,
+        client=auth_client(user),
+        operator=operator,
+        operator2=operator2,
     )
 
-    response = client.get(f"/api/v1.0/operators/{operator.id}/organizations/")
+
+# Permission-only tests call the list view directly: routing, middlewares and
+# rendering play no part in what they check.
+organization_list_view = OperatorOrganizationViewSet.as_view({"get": "list"})
+
+
+def test_api_organizations_list_anonymous(operators_data):
+    """Anonymous users should not be allowed to list operators."""
+    _user, operator, _operator2 = operators_data
+    create_operator_organizations(operator, {})
+
+    request = APIRequestFactory().get(
+        f"/api/v1.0/operators/{operator.id}/organizations/"
+    )
+    response = organization_list_view(request, operator_id=str(operator.id))
     assert response.status_code == 401
-    assert response.json() == {
-        "detail": "Informations d'authentification non fournies."
-    }
+    assert response.data == {"detail": "Informations d'authentification non fournies."}
 
 
-def test_api_organizations_list_authenticated():
+def test_api_organizations_list_authenticated(
+    operators_setup, django_assert_num_queries
+):
     """
     Authenticated users should be able to list organizations of an
     operator for which they have a UserOperatorRole.
     """
-    user = factories.UserFactory()
-    user2 = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-    operator = factories.OperatorFactory()
-    operator2 = factories.OperatorFactory()
-    operator3 = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-    factories.UserOperatorRoleFactory(user=user2, operator=operator2)
-    factories.UserOperatorRoleFactory(user=user2, operator=operator3)
-
-    organization_ok1 = factories.OrganizationFactory(name="A")
-    organization_ok2 = factories.OrganizationFactory(name="B")
-    organization_nok1 = factories.OrganizationFactory(name="C")
-    organization_nok2 = factories.OrganizationFactory(name="D")
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok1
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok2
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator2, organization=organization_nok1
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator2, organization=organization_nok2
+    client = operators_setup.client
+    operator = operators_setup.operator
+    operator2 = operators_setup.operator2
+
+    organization_ok1, organization_ok2 = create_operator_organizations(
+        operator, {"name": "A"}, {"name": "B"}
     )
+    create_operator_organizations(operator2, {"name": "C"}, {"name": "D"})
 
-    response = client.get(f"/api/v1.0/operators/{operator.id}/organizations/")
+    with django_assert_num_queries(5):
+        response = client.get(f"/api/v1.0/operators/{operator.id}/organizations/")
     content = response.json()
     results = content["results"]
     assert len(results) == 2
@@ -81,157 +107,72 @@ def test_api_organizations_list_authenticated():
         ],
     )
 
-    response = client.get(f"/api/v1.0/operators/{operator2.id}/organizations/")
+
+def test_api_organizations_list_authenticated_other_operator(operators_data):
+    """
+    Authenticated users should not be allowed to list organizations of an
+    operator for which they have no UserOperatorRole.
+    """
+    user, _operator, operator2 = operators_data
+    create_operator_organizations(operator2, {"name": "C"})
+
+    request = APIRequestFactory().get(
+        f"/api/v1.0/operators/{operator2.id}/organizations/"
+    )
+    force_authenticate(request, user=user)
+    response = organization_list_view(request, operator_id=str(operator2.id))
     assert response.status_code == 403
 
 
-def test_api_organizations_list_authenticated_order_by():
+@pytest.mark.parametrize(
+    "ordering,expected_order",
+    [
+        ("name", [0, 1, 2, 3]),
+        ("-name", [3, 2, 1, 0]),
+        ("epci_libelle", [0, 1, 2, 3]),
+        ("-epci_libelle", [3, 2, 1, 0]),
+    ],
+)
+def test_api_organizations_list_authenticated_order_by(
+    operators_setup, ordering, expected_order
+):
     """
     Authenticated users should be able to list and order organizations of an
     operator for which they have a UserOperatorRole.
     """
-    user = factories.UserFactory()
-    user2 = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-    operator = factories.OperatorFactory()
-    operator2 = factories.OperatorFactory()
-    operator3 = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-    factories.UserOperatorRoleFactory(user=user2, operator=operator2)
-    factories.UserOperatorRoleFactory(user=user2, operator=operator3)
-
-    organization_ok1 = factories.OrganizationFactory(name="A", epci_libelle="M")
-    organization_ok2 = factories.OrganizationFactory(name="B", epci_libelle="N")
-    organization_ok3 = factories.OrganizationFactory(name="C", epci_libelle="O")
-    organization_ok4 = factories.OrganizationFactory(name="D", epci_libelle="P")
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok1
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok2
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok3
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok4
-    )
-
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/?ordering=name"
-    )
-    content = response.json()
-    results = content["results"]
-    assert len(results) == 4
-    assert_equals_partial(
-        results,
-        [
-            {
-                "id": str(organization_ok1.id),
-                "name": organization_ok1.name,
-            },
-            {
-                "id": str(organization_ok2.id),
-                "name": organization_ok2.name,
-            },
-            {
-                "id": str(organization_ok3.id),
-                "name": organization_ok3.name,
-            },
-            {
-                "id": str(organization_ok4.id),
-                "name": organization_ok4.name,
-            },
-        ],
-    )
-
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/?ordering=-name"
-    )
-    content = response.json()
-    results = content["results"]
-    assert len(results) == 4
-    assert_equals_partial(
-        results,
-        [
-            {
-                "id": str(organization_ok4.id),
-                "name": organization_ok4.name,
-            },
-            {
-                "id": str(organization_ok3.id),
-                "name": organization_ok3.name,
-            },
-            {
-                "id": str(organization_ok2.id),
-                "name": organization_ok2.name,
-            },
-            {
-                "id": str(organization_ok1.id),
-                "name": organization_ok1.name,
-            },
-        ],
-    )
+    client = operators_setup.client
+    operator = operators_setup.operator
 
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/?ordering=epci_libelle"
-    )
-    content = response.json()
-    results = content["results"]
-    assert len(results) == 4
-    assert_equals_partial(
-        results,
-        [
-            {
-                "id": str(organization_ok1.id),
-                "epci_libelle": organization_ok1.epci_libelle,
-            },
-            {
-                "id": str(organization_ok2.id),
-                "epci_libelle": organization_ok2.epci_libelle,
-            },
-            {
-                "id": str(organization_ok3.id),
-                "epci_libelle": organization_ok3.epci_libelle,
-            },
-            {
-                "id": str(organization_ok4.id),
-                "epci_libelle": organization_ok4.epci_libelle,
-            },
-        ],
+    organizations = create_operator_organizations(
+        operator,
+        {"name": "A", "epci_libelle": "M"},
+        {"name": "B", "epci_libelle": "N"},
+        {"name": "C", "epci_libelle": "O"},
+        {"name": "D", "epci_libelle": "P"},
     )
 
     response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/?ordering=-epci_libelle"
+        f"/api/v1.0/operators/{operator.id}/organizations/?ordering={ordering}"
     )
     content = response.json()
     results = content["results"]
     assert len(results) == 4
-    assert_equals_partial(
+    assert_items_match(
         results,
         [
             {
-                "id": str(organization_ok4.id),
-                "epci_libelle": organization_ok4.epci_libelle,
-            },
-            {
-                "id": str(organization_ok3.id),
-                "epci_libelle": organization_ok3.epci_libelle,
-            },
-            {
-                "id": str(organization_ok2.id),
-                "epci_libelle": organization_ok2.epci_libelle,
-            },
-            {
-                "id": str(organization_ok1.id),
-                "epci_libelle": organization_ok1.epci_libelle,
-            },
+                "id": str(organizations[index].id),
+                "name": organizations[index].name,
+                "epci_libelle": organizations[index].epci_libelle,
+            }
+            for index in expected_order
         ],
     )
 
 
-def test_api_organizations_list_authenticated_search():
+def test_api_organizations_list_authenticated_search(
+    operators_setup, django_assert_num_queries
+):
     """
     Authenticated users should be able to list and search organizations of an
     operator for which they have a UserOperatorRole.
@@ -239,54 +180,36 @@ def test_api_organizations_list_authenticated_search():
     Search is case insensitive and accent insensitive.
     The order of the results is based on the match priority: name first, then departement_code_insee, then epci_libelle.
     """
-    user = factories.UserFactory()
-    user2 = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-    operator = factories.OperatorFactory()
-    operator2 = factories.OperatorFactory()
-    operator3 = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-    factories.UserOperatorRoleFactory(user=user2, operator=operator2)
-    factories.UserOperatorRoleFactory(user=user2, operator=operator3)
-
-    organization_ok1 = factories.OrganizationFactory(
-        name="Évreux",
-        epci_libelle="CA Evreux Portes de Normandie",
-        departement_code_insee="27",
-    )
-    organization_ok2 = factories.OrganizationFactory(
-        name="Bondoufle",
-        epci_libelle="Communauté d'agglomération Évry Centre Essonne",
-        departement_code_insee="91",
-    )
-    organization_ok3 = factories.OrganizationFactory(
-        name="Paris", epci_libelle="CA Paris", departement_code_insee="75"
-    )
-    organization_ok4 = factories.OrganizationFactory(
-        name="Truc",
-        epci_libelle="CA Evreux Portes de Normandie",
-        departement_code_insee="27",
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok1
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok2
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok3
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok4
-    )
+    client = operators_setup.client
+    operator = operators_setup.operator
 
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/?search=Evr"
+    create_operator_organizations(
+        operator,
+        {
+            "name": "Évreux",
+            "epci_libelle": "CA Evreux Portes de Normandie",
+            "departement_code_insee": "27",
+        },
+        {
+            "name": "Bondoufle",
+            "epci_libelle": "Communauté d'agglomération Évry Centre Essonne",
+            "departement_code_insee": "91",
+        },
+        {"name": "Paris", "epci_libelle": "CA Paris", "departement_code_insee": "75"},
+        {
+            "name": "Truc",
+            "epci_libelle": "CA Evreux Portes de Normandie",
+            "departement_code_insee": "27",
+        },
     )
+
+    url = f"/api/v1.0/operators/{operator.id}/organizations/"
+
+    with django_assert_num_queries(5):
+        response = client.get(url, {"search": "Evr"})
     content = response.json()
     results = content["results"]
-    assert_equals_partial(
+    assert_items_match(
         results,
         [
             {
@@ -304,12 +227,11 @@ def test_api_organizations_list_authenticated_search():
         ],
     )
 
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/?search=Evreux"
-    )
+    with django_assert_num_queries(5):
+        response = client.get(url, {"search": "Evreux"})
     content = response.json()
     results = content["results"]
-    assert_equals_partial(
+    assert_items_match(
         results,
         [
             {
@@ -323,10 +245,11 @@ def test_api_organizations_list_authenticated_search():
         ],
     )
 
-    response = client.get(f"/api/v1.0/operators/{operator.id}/organizations/?search=91")
+    with django_assert_num_queries(5):
+        response = client.get(url, {"search": "91"})
     content = response.json()
     results = content["results"]
-    assert_equals_partial(
+    assert_items_match(
         results,
         [
             {
@@ -337,96 +260,118 @@ def test_api_organizations_list_authenticated_search():
     )
 
 
-def test_api_organizations_retrieve_authenticated():
+def test_api_organizations_list_authenticated_pagination(
+    operators_setup, django_assert_num_queries
+):
     """
-    Authenticated users should be able to retrieve organizations of an operator
-    for which they have a UserOperatorRole.
+    Organizations should be split in pages of 20, the next page being reachable
+    from the "next" link of the previous one, at the same query cost.
     """
-    user = factories.UserFactory()
-    user2 = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-    operator = factories.OperatorFactory()
-    operator2 = factories.OperatorFactory()
-    operator3 = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-    factories.UserOperatorRoleFactory(user=user2, operator=operator2)
-    factories.UserOperatorRoleFactory(user=user2, operator=operator3)
-
-    organization_ok1 = factories.OrganizationFactory(
-        rpnt=["1.1", "1.2", "2.1", "2.2", "2.3"],
-        adresse_messagerie="contact@commune.fr",
-        site_internet="https://www.commune.fr",
-    )
-    organization_ok2 = factories.OrganizationFactory()
-    organization_nok1 = factories.OrganizationFactory()
-    organization_nok2 = factories.OrganizationFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok1
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok2
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator2, organization=organization_nok1
+    client = operators_setup.client
+    operator = operators_setup.operator
+
+    create_operator_organizations(
+        operator, *({"name": f"Organization {index:02d}"} for index in range(25))
+    )
+
+    with django_assert_num_queries(5):
+        response = client.get(
+            f"/api/v1.0/operators/{operator.id}/organizations/?ordering=name"
+        )
+    first_page = response.json()
+    assert first_page["count"] == 25
+    assert first_page["previous"] is None
+    assert len(first_page["results"]) == 20
+
+    with django_assert_num_queries(5):
+        response = client.get(first_page["next"])
+    second_page = response.json()
+    assert second_page["next"] is None
+    assert [organization["name"] for organization in second_page["results"]] == [
+        f"Organization {index:02d}" for index in range(20, 25)
+    ]
+
+    first_page_ids = {organization["id"] for organization in first_page["results"]}
+    second_page_ids = {organization["id"] for organization in second_page["results"]}
+    assert not first_page_ids & second_page_ids
+
+
+def test_api_organizations_list_authenticated_query_count_constant(
+    operators_setup, django_assert_num_queries
+):
+    """
+    Listing organizations should cost the same number of queries whatever the
+    number of organizations and of service subscriptions on the page.
+    """
+    client = operators_setup.client
+    operator = operators_setup.operator
+    service = factories.ServiceFactory()
+
+    organizations = create_operator_organizations(
+        operator, *({"name": f"Organization {index:02d}"} for index in range(50))
     )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator2, organization=organization_nok2
+    models.ServiceSubscription.objects.bulk_create(
+        [
+            models.ServiceSubscription(
+                organization=organization, operator=operator, service=service
+            )
+            for organization in organizations
+        ]
     )
 
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization_ok1.id}/"
-    )
+    with django_assert_num_queries(7):
+        response = client.get(f"/api/v1.0/operators/{operator.id}/organizations/")
     content = response.json()
-    results = content
-    assert_equals_partial(
-        results,
-        {
-            "id": str(organization_ok1.id),
-            "name": organization_ok1.name,
-            "mail_domain": "commune.fr",
-            "mail_domain_status": Organization.MailDomainStatus.VALID,
-        },
+    assert content["count"] == 50
+    assert len(content["results"]) == 20
+    assert all(
+        len(organization["service_subscriptions"]) == 1
+        for organization in content["results"]
     )
 
 
-def test_api_organizations_retrieve_authenticated_no_role():
+@pytest.mark.parametrize(
+    "target_operator,expected_status", [("operator", 200), ("operator2", 403)]
+)
+def test_api_organizations_retrieve_authenticated(
+    operators_setup, target_operator, expected_status
+):
     """
-    Authenticated users should not be able to retrieve organizations for which
-    they have no UserOperatorRole.
+    Authenticated users should be able to retrieve organizations of an operator
+    for which they have a UserOperatorRole, and only those.
     """
-    user = factories.UserFactory()
-    user2 = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-    operator = factories.OperatorFactory()
-    operator2 = factories.OperatorFactory()
-    operator3 = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-    factories.UserOperatorRoleFactory(user=user2, operator=operator2)
-    factories.UserOperatorRoleFactory(user=user2, operator=operator3)
-
-    organization_ok1 = factories.OrganizationFactory()
-    organization_ok2 = factories.OrganizationFactory()
-    organization_nok1 = factories.OrganizationFactory()
-    organization_nok2 = factories.OrganizationFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok1
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok2
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator2, organization=organization_nok1
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator2, organization=organization_nok2
-    )
+    client = operators_setup.client
+    organizations = {
+        operator_name: create_operator_organizations(
+            getattr(operators_setup, operator_name),
+            {
+                "rpnt": ["1.1", "1.2", "2.1", "2.2", "2.3"],
+                "adresse_messagerie": "contact@commune.fr",
+                "site_internet": "https://www.commune.fr",
+            },
+            {},
+        )[0]
+        for operator_name in ["operator", "operator2"]
+    }
 
+    operator = getattr(operators_setup, target_operator)
+    organization = organizations[target_operator]
     response = client.get(
-        f"/api/v1.0/operators/{operator2.id}/organizations/{organization_nok1.id}/"
+        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/"
     )
-    assert response.status_code == 403
-    assert response.json() == {
-        "detail": "Vous n'avez pas la permission d'effectuer cette action."
-    }
+    assert response.status_code == expected_status
+
+    if expected_status == 403:
+        assert response.json() == {
+            "detail": "Vous n'avez pas la permission d'effectuer cette action."
+        }
+    else:
+        assert_equals_partial(
+            response.json(),
+            {
+                "id": str(organization.id),
+                "name": organization.name,
+                "mail_domain": "commune.fr",
+                "mail_domain_status": models.Organization.MailDomainStatus.VALID,
+            },
+        )
@@ -6,80 +6,95 @@ Test service logo API endpoints in the deploycenter core app.
 
 import pytest
 
-from core import factories
+from core import factories, models
 
 pytestmark = pytest.mark.django_db
 
+SVG_CIRCLE = b'<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100"><circle cx="50" cy="50" r="40" fill="blue"/></svg>'
+SVG_UNICODE = '<?xml version="1.0" encoding="UTF-8"?><svg xmlns="http://www.w3.org/2000/svg" width="100" height="100"><text x="50" y="50" text-anchor="middle">Testé</text></svg>'.encode(
+    "utf-8"
+)
+
+
+@pytest.fixture(name="logo_services", scope="module")
+def fixture_logo_services(module_db):
+    """
+    Create one service per logo case, with a single INSERT, once for the whole
+    module.
+    """
+    with module_db():
+        cases = {
+            "active": {"is_active": True, "logo_svg": SVG_CIRCLE},
+            "no_logo": {"is_active": True, "logo_svg": None},
+            "inactive": {"is_active": False, "logo_svg": SVG_CIRCLE},
+            "empty_logo": {"is_active": True, "logo_svg": b""},
+            "unicode": {"is_active": True, "logo_svg": SVG_UNICODE},
+        }
+        services = models.Service.objects.bulk_create(
+            [factories.ServiceFactory.build(**fields) for fields in cases.values()]
+        )
+        yield dict(zip(cases, services, strict=True))
+
 
 class TestServiceLogoViewSet:
     """Test the service logo endpoint."""
 
-    def test_get_service_logo_success(self, api_client):
+    def test_get_service_logo_success(self, anon_client, logo_services):
         """Test successful retrieval of service logo."""
-        # Create test data with logo
-        svg_content = b'<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100"><circle cx="50" cy="50" r="40" fill="blue"/></svg>'
-        service = factories.ServiceFactory(is_active=True, logo_svg=svg_content)
+        service = logo_services["active"]
 
         # Test GET request (no authentication required)
-        response = api_client.get(f"/api/v1.0/servicelogo/{service.id}/")
+        response = anon_client.get(f"/api/v1.0/servicelogo/{service.id}/")
 
         assert response.status_code == 200
         assert response["Content-Type"] == "image/svg+xml; charset=utf-8"
         assert response["Content-Disposition"] == 'inline; filename="logo.svg"'
         assert response["Cache-Control"] == "public, max-age=3600"
         assert response["Access-Control-Allow-Origin"] == "*"
-        assert response.content == svg_content
+        assert response.content == SVG_CIRCLE
 
-    def test_get_service_logo_not_found(self, api_client):
+    def test_get_service_logo_not_found(self, anon_client):
         """Test 404 when service doesn't exist."""
         # Test with non-existent service ID
-        response = api_client.get("/api/v1.0/servicelogo/99999/")
+        response = anon_client.get("/api/v1.0/servicelogo/99999/")
 
         assert response.status_code == 404
         data = response.json()
         assert data["detail"] == "No Service matches the given query."
 
-    def test_get_service_logo_no_logo(self, api_client):
+    def test_get_service_logo_no_logo(self, anon_client, logo_services):
         """Test 404 when service exists but has no logo."""
-        # Create service without logo
-        service = factories.ServiceFactory(is_active=True, logo_svg=None)
+        service = logo_services["no_logo"]
 
-        response = api_client.get(f"/api/v1.0/servicelogo/{service.id}/")
+        response = anon_client.get(f"/api/v1.0/servicelogo/{service.id}/")
 
         assert response.status_code == 404
         assert response.json()
 
-    def test_get_service_logo_inactive_service(self, api_client):
+    def test_get_service_logo_inactive_service(self, anon_client, logo_services):
         """Test 404 when service is inactive."""
-        # Create inactive service with logo
-        svg_content = b'<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100"><circle cx="50" cy="50" r="40" fill="blue"/></svg>'
-        service = factories.ServiceFactory(is_active=False, logo_svg=svg_content)
+        service = logo_services["inactive"]
 
-        response = api_client.get(f"/api/v1.0/servicelogo/{service.id}/")
+        response = anon_client.get(f"/api/v1.0/servicelogo/{service.id}/")
 
         assert response.status_code == 404
 
-    def test_get_service_logo_empty_logo(self, api_client):
+    def test_get_service_logo_empty_logo(self, anon_client, logo_services):
         """Test 404 when service has empty logo."""
-        # Create service with empty logo
-        service = factories.ServiceFactory(is_active=True, logo_svg=b"")
+        service = logo_services["empty_logo"]
 
-        response = api_client.get(f"/api/v1.0/servicelogo/{service.id}/")
+        response = anon_client.get(f"/api/v1.0/servicelogo/{service.id}/")
 
         assert response.status_code == 404
         data = response.json()
         assert data["detail"] == "Logo not found for this service"
 
-    def test_get_service_logo_unicode_content(self, api_client):
+    def test_get_service_logo_unicode_content(self, anon_client, logo_services):
         """Test service logo with unicode content."""
-        # Create test data with unicode SVG content
-        svg_content = '<?xml version="1.0" encoding="UTF-8"?><svg xmlns="http://www.w3.org/2000/svg" width="100" height="100"><text x="50" y="50" text-anchor="middle">Testé</text></svg>'.encode(
-            "utf-8"
-        )
-        service = factories.ServiceFactory(is_active=True, logo_svg=svg_content)
+        service = logo_services["unicode"]
 
-        response = api_client.get(f"/api/v1.0/servicelogo/{service.id}/")
+        response = anon_client.get(f"/api/v1.0/servicelogo/{service.id}/")
 
         assert response.status_code == 200
         assert response["Content-Type"] == "image/svg+xml; charset=utf-8"
-        assert response.content == svg_content
+        assert response.content == SVG_UNICODE
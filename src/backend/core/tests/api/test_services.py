@@ -2,80 +2,199 @@
 Test users API endpoints in the deploycenter core app.
 """
 
-# pylint: disable=too-many-lines
+import json
+from dataclasses import dataclass
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse
 
 import pytest
-from rest_framework.test import APIClient
+from rest_framework.test import APIRequestFactory, force_authenticate
 
-from core import factories
+from core import factories, models
+from core.api.serializers import OrganizationServiceSerializer
+from core.tests.utils import assert_equals_partial, create_operator_organizations
 
 pytestmark = pytest.mark.django_db
 
 
-def test_api_organizations_services_list_anonymous():
-    """Anonymous users should not be allowed to retrieve organization services."""
-    factories.UserFactory.create_batch(2)
-    client = APIClient()
+@dataclass(frozen=True)
+class OperatorWorld:
+    """Users, operators and organizations shared by the tests of this module."""
+
+    user: models.User
+    user2: models.User
+    operator: models.Operator
+    operator2: models.Operator
+    organization_ok1: models.Organization
+    organization_ok2: models.Organization
+    organization_nok1: models.Organization
+
+
+@pytest.fixture(name="operator_world", scope="module")
+def fixture_operator_world(module_db):
+    """
+    Create, once for the whole module and with one INSERT per table, a user with a
+    role on an operator managing organizations A and B, another operator managing
+    organizations C and D, and a user with no role at all.
 
-    operator = factories.OperatorFactory()
-    organization = factories.OrganizationFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization
+    Organization D is only there for the operator to have several organizations
+    it does not manage: no test needs a handle on it.
+    """
+    with module_db():
+        user, user2 = models.User.objects.bulk_create(
+            factories.UserFactory.build_batch(2)
+        )
+        operator, operator2 = models.Operator.objects.bulk_create(
+            factories.OperatorFactory.build_batch(2)
+        )
+        organization_ok1, organization_ok2, organization_nok1, organization_nok2 = (
+            models.Organization.objects.bulk_create(
+                [factories.OrganizationFactory.build(name=name) for name in "ABCD"]
+            )
+        )
+        factories.UserOperatorRoleFactory(user=user, operator=operator)
+        models.OperatorOrganizationRole.objects.bulk_create(
+            [
+                factories.OperatorOrganizationRoleFactory.build(
+                    operator=operator_with_role, organization=organization
+                )
+                for operator_with_role, organization in [
+                    (operator, organization_ok1),
+                    (operator, organization_ok2),
+                    (operator2, organization_nok1),
+                    (operator2, organization_nok2),
+                ]
+            ]
+        )
+
+        yield OperatorWorld(
+            user=user,
+            user2=user2,
+            operator=operator,
+            operator2=operator2,
+            organization_ok1=organization_ok1,
+            organization_ok2=organization_ok2,
+            organization_nok1=organization_nok1,
+        )
+
+
+def services_url(operator, organization):
+    """Return the URL of the services of an organization managed by an operator."""
+    return reverse(
+        "service-list",
+        kwargs={"operator_id": operator.id, "organization_id": organization.id},
+    )
+
+
+def service_url(operator, organization, service):
+    """Return the URL of a service of an organization managed by an operator."""
+    return reverse(
+        "service-detail",
+        kwargs={
+            "operator_id": operator.id,
+            "organization_id": organization.id,
+            "pk": service.id,
+        },
     )
 
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/services/"
+
+def subscription_url(operator, organization, service):
+    """Return the URL of the subscription of an organization to a service."""
+    return reverse(
+        "organizationservice-subscription",
+        kwargs={
+            "operator_id": operator.id,
+            "organization_id": organization.id,
+            "service_id": service.id,
+        },
+    )
+
+
+def create_services(*services_kwargs):
+    """
+    Create one service per set of field values with a single INSERT, skipping the
+    validation queries that saving each one through its factory would run.
+    """
+    return models.Service.objects.bulk_create(
+        [factories.ServiceFactory.build(**kwargs) for kwargs in services_kwargs]
+    )
+
+
+def call_view(url, user=None, method="get", payload=None):
+    """
+    Call the view routed for a URL directly, authenticated as the given user, and
+    return its rendered response.
+
+    Middlewares and the test client play no part in what the tests of a single
+    view check, so they are skipped.
+    """
+    match = resolve(url)
+    request = getattr(APIRequestFactory(), method)(url, payload, format="json")
+    if user is not None:
+        force_authenticate(request, user=user)
+    return match.func(request, *match.args, **match.kwargs).render()
+
+
+def test_api_organizations_services_list_anonymous(operator_world):
+    """Anonymous users should not be allowed to retrieve organization services."""
+    response = call_view(
+        services_url(operator_world.operator, operator_world.organization_ok1)
     )
     assert response.status_code == 401
 
 
-def test_api_organizations_services_list_authenticated():
+def test_api_organizations_services_list_operator_looked_up_once(operator_world):
+    """
+    The operator found when checking the user's role is reused by the view, so it
+    is only queried once per request.
+    """
+    url = services_url(operator_world.operator, operator_world.organization_ok1)
+
+    with CaptureQueriesContext(connection) as context:
+        response = call_view(url, operator_world.user)
+    assert response.status_code == 200
+
+    operator_queries = [
+        query["sql"]
+        for query in context.captured_queries
+        if query["sql"].startswith('SELECT "deploycenter_operator"."id"')
+    ]
+    assert len(operator_queries) == 1
+
+
+def test_api_organizations_services_list_authenticated(
+    auth_client, operator_world, django_assert_num_queries
+):
     """
     Authenticated users should be able to retrieve organization services of an operator
     for which they have a UserOperatorRole.
     """
-    user = factories.UserFactory()
-    user2 = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-    operator = factories.OperatorFactory()
-    operator2 = factories.OperatorFactory()
-    operator3 = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-    factories.UserOperatorRoleFactory(user=user2, operator=operator2)
-    factories.UserOperatorRoleFactory(user=user2, operator=operator3)
-
-    organization_ok1 = factories.OrganizationFactory(name="A")
-    organization_ok2 = factories.OrganizationFactory(name="B")
-    organization_nok1 = factories.OrganizationFactory(name="C")
-    organization_nok2 = factories.OrganizationFactory(name="D")
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok1
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok2
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator2, organization=organization_nok1
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator2, organization=organization_nok2
-    )
+    client = auth_client(operator_world.user)
+    operator = operator_world.operator
+    operator2 = operator_world.operator2
+    organization_ok1 = operator_world.organization_ok1
+    organization_ok2 = operator_world.organization_ok2
+    organization_nok1 = operator_world.organization_nok1
 
-    service1 = factories.ServiceFactory()
-    service2 = factories.ServiceFactory()
-    service3 = factories.ServiceFactory()
-    service4 = factories.ServiceFactory()
+    service1, service2, service3, service4 = models.Service.objects.bulk_create(
+        factories.ServiceFactory.build_batch(4)
+    )
 
     # Create OperatorServiceConfig for some services
-    config1 = factories.OperatorServiceConfigFactory(
-        operator=operator, service=service1, display_priority=10
-    )
-    config2 = factories.OperatorServiceConfigFactory(
-        operator=operator, service=service2, display_priority=5
-    )
-    config4 = factories.OperatorServiceConfigFactory(
-        operator=operator, service=service4, display_priority=15
+    config1, config2, config4 = models.OperatorServiceConfig.objects.bulk_create(
+        [
+            factories.OperatorServiceConfigFactory.build(
+                operator=operator, service=service1, display_priority=10
+            ),
+            factories.OperatorServiceConfigFactory.build(
+                operator=operator, service=service2, display_priority=5
+            ),
+            factories.OperatorServiceConfigFactory.build(
+                operator=operator, service=service4, display_priority=15
+            ),
+        ]
     )
     # service3 has no config - should still appear if it has a subscription
     # service4 has config but no subscription - should appear
@@ -95,76 +214,48 @@ def test_api_organizations_services_list_authenticated():
         organization=organization_nok1, service=service2, operator=operator2
     )
 
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization_ok1.id}/services/"
-    )
+    # The operator, its service configs, the subscriptions and the required
+    # services are fetched once for the whole page, whatever the number of services.
+    with django_assert_num_queries(10):
+        response = client.get(services_url(operator, organization_ok1))
     assert response.status_code == 200
     content = response.json()
     results = content["results"]
-    assert len(results) == 4
-
-    # Results are ordered by service id - find each service in results
-    results_by_id = {result["id"]: result for result in results}
-
-    # Check service1 (has subscription and config)
-    service1_result = results_by_id[service1.id]
-    assert service1_result["name"] == service1.name
-    assert service1_result["subscription"] is not None
-    assert "is_active" in service1_result["subscription"]
-    assert (
-        service1_result["operator_config"]["display_priority"]
-        == config1.display_priority
-    )
-    assert (
-        service1_result["operator_config"]["externally_managed"]
-        == config1.externally_managed
-    )
 
-    # Check service2 (has subscription and config)
-    service2_result = results_by_id[service2.id]
-    assert service2_result["name"] == service2.name
-    assert service2_result["subscription"] is not None
-    assert "is_active" in service2_result["subscription"]
-    assert (
-        service2_result["operator_config"]["display_priority"]
-        == config2.display_priority
-    )
-    assert (
-        service2_result["operator_config"]["externally_managed"]
-        == config2.externally_managed
-    )
-
-    # Check service3 (has subscription, no config)
-    service3_result = results_by_id[service3.id]
-    assert service3_result["name"] == service3.name
-    assert service3_result["subscription"] is not None
-    assert "is_active" in service3_result["subscription"]
-    assert service3_result["operator_config"] is None
-
-    # Check service4 (has config, no subscription)
-    service4_result = results_by_id[service4.id]
-    assert service4_result["name"] == service4.name
-    assert service4_result["subscription"] is None
-    assert (
-        service4_result["operator_config"]["display_priority"]
-        == config4.display_priority
-    )
-    assert (
-        service4_result["operator_config"]["externally_managed"]
-        == config4.externally_managed
+    # Results are ordered by service id, which follows their creation order.
+    # Only service4 has no subscription, and only service3 has no operator config.
+    assert_equals_partial(
+        results,
+        [
+            {
+                "id": service.id,
+                "name": service.name,
+                "subscription": {"is_active": True} if subscribed else None,
+                "operator_config": {
+                    "display_priority": config.display_priority,
+                    "externally_managed": config.externally_managed,
+                }
+                if config
+                else None,
+            }
+            for service, subscribed, config in [
+                (service1, True, config1),
+                (service2, True, config2),
+                (service3, True, None),
+                (service4, False, config4),
+            ]
+        ],
     )
 
     # Test the list of organizations with services
-    response = client.get(f"/api/v1.0/operators/{operator.id}/organizations/")
+    with django_assert_num_queries(7):
+        response = client.get(f"/api/v1.0/operators/{operator.id}/organizations/")
     content = response.json()
-    results = content["results"]
-    assert len(results) == 2
-
-    # Find organizations by id
-    results_by_id = {result["id"]: result for result in results}
+    # Organizations are ordered by name
+    org1_result, org2_result = content["results"]
 
     # Check organization_ok1 has 3 service subscriptions
-    org1_result = results_by_id[str(organization_ok1.id)]
+    assert org1_result["id"] == str(organization_ok1.id)
     assert org1_result["name"] == organization_ok1.name
     assert len(org1_result["service_subscriptions"]) == 3
 
@@ -181,7 +272,7 @@ def test_api_organizations_services_list_authenticated():
     assert org1_result["service_subscriptions"][2]["is_active"] is True
 
     # Check organization_ok2 has no service subscriptions
-    org2_result = results_by_id[str(organization_ok2.id)]
+    assert org2_result["id"] == str(organization_ok2.id)
     assert org2_result["name"] == organization_ok2.name
     assert len(org2_result["service_subscriptions"]) == 0
 
@@ -189,361 +280,153 @@ def test_api_organizations_services_list_authenticated():
     response = client.get(f"/api/v1.0/operators/{operator2.id}/organizations/")
     assert response.status_code == 403
 
-    response = client.get(
-        f"/api/v1.0/operators/{operator2.id}/organizations/{organization_ok1.id}/services/"
-    )
+    response = client.get(services_url(operator2, organization_ok1))
     assert response.status_code == 403
 
 
-def test_api_organization_service_enable_delete():
-    """Authenticated users should be able to enable and delete a service subscription for an organization."""
-    user = factories.UserFactory()
-    user2 = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-    operator = factories.OperatorFactory()
-    operator2 = factories.OperatorFactory()
-    operator3 = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-    factories.UserOperatorRoleFactory(user=user2, operator=operator2)
-    factories.UserOperatorRoleFactory(user=user2, operator=operator3)
-
-    organization_ok1 = factories.OrganizationFactory(name="A")
-    organization_ok2 = factories.OrganizationFactory(name="B")
-    organization_nok1 = factories.OrganizationFactory()
-    organization_nok2 = factories.OrganizationFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok1
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok2
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator2, organization=organization_nok1
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator2, organization=organization_nok2
-    )
-
-    service1 = factories.ServiceFactory()
-    service2 = factories.ServiceFactory()
-    factories.ServiceSubscriptionFactory(
-        organization=organization_nok1, service=service2, operator=operator2
-    )
-
-    # Test that no subscription exists
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization_ok1.id}/services/{service1.id}/subscription/"
-    )
-    assert response.status_code == 404
-
-    # Test that the subscription can be created
-    response = client.patch(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization_ok1.id}/services/{service1.id}/subscription/",
-        {},
-        format="json",
-    )
-    assert response.status_code == 201
-    content_created = response.json()
-    assert "metadata" in content_created
-    assert "created_at" in content_created
-
-    # Test that the subscription exists
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization_ok1.id}/services/{service1.id}/subscription/"
-    )
-    assert response.status_code == 200
-    content_retrieved = response.json()
-    assert content_retrieved["metadata"] == content_created["metadata"]
-    assert content_retrieved["created_at"] == content_created["created_at"]
-    assert content_retrieved["is_active"] == content_created["is_active"]
-
-    # Test that the subscription can be deleted
-    url = (
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization_ok1.id}/"
-        f"services/{service1.id}/subscription/"
-    )
-    response = client.delete(url)
-    assert response.status_code == 204
+# Each step of the subscription lifecycle: the HTTP method, its payload, the
+# expected status and, when a subscription is returned, its expected state.
+# PATCH responses return the saved subscription, so it is only retrieved once.
+# Deletions are checked in the database: the 404 of a missing subscription is
+# covered by the first step.
+SUBSCRIPTION_LIFECYCLE = [
+    ("get", None, 404, None),
+    ("patch", {}, 201, False),
+    ("get", None, 200, False),
+    ("delete", None, 204, None),
+    ("patch", {"is_active": True}, 201, True),
+    ("patch", {"is_active": False}, 200, False),
+    ("delete", None, 204, None),
+    ("patch", {"is_active": False}, 201, False),
+    ("patch", {"is_active": True}, 200, True),
+]
+
+
+def test_api_organization_service_subscription_lifecycle(operator_world):
+    """
+    Authenticated users should be able to enable, deactivate, reactivate and delete
+    a service subscription for an organization.
+    """
+    organization_ok1 = operator_world.organization_ok1
 
-    # Test that the subscription does not exist
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization_ok1.id}/"
-        f"services/{service1.id}/subscription/"
-    )
-    assert response.status_code == 404
-
-
-def test_api_organization_service_inactive():
-    """Authenticated users should be able set inactive a service subscription for an organization."""
-    user = factories.UserFactory()
-    user2 = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-    operator = factories.OperatorFactory()
-    operator2 = factories.OperatorFactory()
-    operator3 = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-    factories.UserOperatorRoleFactory(user=user2, operator=operator2)
-    factories.UserOperatorRoleFactory(user=user2, operator=operator3)
-
-    organization_ok1 = factories.OrganizationFactory(name="A")
-    organization_ok2 = factories.OrganizationFactory(name="B")
-    organization_nok1 = factories.OrganizationFactory()
-    organization_nok2 = factories.OrganizationFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok1
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok2
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator2, organization=organization_nok1
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator2, organization=organization_nok2
+    service1, service2 = models.Service.objects.bulk_create(
+        factories.ServiceFactory.build_batch(2)
     )
-
-    service1 = factories.ServiceFactory()
-    service2 = factories.ServiceFactory()
     factories.ServiceSubscriptionFactory(
-        organization=organization_nok1, service=service2, operator=operator2
-    )
-
-    # Test that no subscription exists
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization_ok1.id}/services/{service1.id}/subscription/"
-    )
-    assert response.status_code == 404
-
-    # Test that the subscription can be created with is_active=True
-    response = client.patch(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization_ok1.id}/services/{service1.id}/subscription/",
-        {"is_active": True},
-        format="json",
-    )
-    assert response.status_code == 201
-    content_created = response.json()
-    assert "metadata" in content_created
-    assert "created_at" in content_created
-    assert content_created["is_active"] is True
-
-    # Test that the subscription exists
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization_ok1.id}/services/{service1.id}/subscription/"
-    )
-    assert response.status_code == 200
-    content_retrieved = response.json()
-    assert content_retrieved["metadata"] == content_created["metadata"]
-    assert content_retrieved["created_at"] == content_created["created_at"]
-    assert content_retrieved["is_active"] == content_created["is_active"]
-
-    # Test that the subscription can be set inactive via PATCH
-    url = (
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization_ok1.id}/"
-        f"services/{service1.id}/subscription/"
-    )
-    response = client.patch(url, {"is_active": False}, format="json")
-    assert response.status_code == 200
-    content_updated = response.json()
-    assert content_updated["is_active"] is False
-
-    # Test that the subscription is inactive
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization_ok1.id}/"
-        f"services/{service1.id}/subscription/"
-    )
-    assert response.status_code == 200
-    content_retrieved = response.json()
-    assert content_retrieved["is_active"] is False
-
-    # Delete the subscription to test creating with is_active=False
-    response = client.delete(url)
-    assert response.status_code == 204
-
-    # Test that the subscription can be created with is_active=False
-    response = client.patch(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization_ok1.id}/services/{service1.id}/subscription/",
-        {"is_active": False},
-        format="json",
-    )
-    assert response.status_code == 201
-    content_created_inactive = response.json()
-    assert content_created_inactive["is_active"] is False
-
-    # Verify it's inactive
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization_ok1.id}/services/{service1.id}/subscription/"
-    )
-    assert response.status_code == 200
-    content_retrieved = response.json()
-    assert content_retrieved["is_active"] is False
-
-    # Test that the subscription can be set active via PATCH
-    response = client.patch(url, {"is_active": True}, format="json")
-    assert response.status_code == 200
-    content_updated = response.json()
-    assert content_updated["is_active"] is True
-
-
-def test_api_organization_service_enable_disable_no_role():
+        organization=operator_world.organization_nok1,
+        service=service2,
+        operator=operator_world.operator2,
+    )
+
+    url = subscription_url(operator_world.operator, organization_ok1, service1)
+    subscriptions = models.ServiceSubscription.objects.filter(
+        operator=operator_world.operator,
+        organization=organization_ok1,
+        service=service1,
+    )
+    # Payload of the last creation, the following updates must keep its metadata
+    content_created = {}
+    for method, payload, expected_status, expected_is_active in SUBSCRIPTION_LIFECYCLE:
+        response = call_view(url, operator_world.user, method, payload)
+        assert response.status_code == expected_status, (method, payload)
+        if method == "delete":
+            assert not subscriptions.exists()
+        if expected_is_active is None:
+            continue
+
+        content = json.loads(response.content)
+        assert content["is_active"] is expected_is_active
+        if expected_status == 201:
+            assert "metadata" in content
+            assert "created_at" in content
+            content_created = content
+        else:
+            assert content_created, "An update step must follow a creation step"
+            assert content["metadata"] == content_created["metadata"]
+            assert content["created_at"] == content_created["created_at"]
+
+
+def test_api_organization_service_enable_disable_no_role(operator_world):
     """
     Authenticated users should not be able to enable and disable a service for an
     organization for which they have no UserOperatorRole.
     """
-    user = factories.UserFactory()
-    user2 = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user2)
-    operator = factories.OperatorFactory()
-    operator2 = factories.OperatorFactory()
-    operator3 = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-    factories.UserOperatorRoleFactory(user=user2, operator=operator2)
-    factories.UserOperatorRoleFactory(user=user2, operator=operator3)
-
-    organization_ok1 = factories.OrganizationFactory(name="A")
-    organization_ok2 = factories.OrganizationFactory(name="B")
-    organization_nok1 = factories.OrganizationFactory()
-    organization_nok2 = factories.OrganizationFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok1
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization_ok2
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator2, organization=organization_nok1
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator2, organization=organization_nok2
-    )
+    user = operator_world.user2
+    operator = operator_world.operator
+    organization_ok1 = operator_world.organization_ok1
 
-    service1 = factories.ServiceFactory()
-    factories.ServiceFactory()
+    [service1] = create_services({})
     factories.ServiceSubscriptionFactory(
         organization=organization_ok1, service=service1, operator=operator
     )
 
     # Test that it cannot be retrieved
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization_ok1.id}/services/{service1.id}/subscription/"
-    )
+    url = subscription_url(operator, organization_ok1, service1)
+    response = call_view(url, user)
     assert response.status_code == 403
 
     # Test that the subscription cannot be created
-    response = client.patch(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization_ok1.id}/services/{service1.id}/subscription/",
-        {},
-        format="json",
-    )
+    response = call_view(url, user, "patch", {})
     assert response.status_code == 403
 
     # Test that the subscription cannot be deleted
-    response = client.delete(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization_ok1.id}"
-        f"/services/{service1.id}/subscription/"
-    )
+    response = call_view(url, user, "delete")
     assert response.status_code == 403
 
 
-def test_api_organization_service_subscription_post_not_allowed():
-    """Test that POST method is not allowed for subscription endpoint."""
-    user = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-    operator = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-    organization = factories.OrganizationFactory()
-    service = factories.ServiceFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization
-    )
-
-    response = client.post(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/services/{service.id}/subscription/",
-        {},
-        format="json",
-    )
-    assert response.status_code == 405
-
-
-def test_api_organization_service_subscription_put_not_allowed():
-    """Test that PUT method is not allowed for subscription endpoint."""
-    user = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-    operator = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-    organization = factories.OrganizationFactory()
-    service = factories.ServiceFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization
+@pytest.mark.parametrize("method,payload", [("post", {}), ("put", {"is_active": True})])
+def test_api_organization_service_subscription_method_not_allowed(
+    operator_world, method, payload
+):
+    """Test that POST and PUT methods are not allowed for subscription endpoint."""
+    [service] = create_services({})
+    url = subscription_url(
+        operator_world.operator, operator_world.organization_ok1, service
     )
 
-    response = client.put(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/services/{service.id}/subscription/",
-        {"is_active": True},
-        format="json",
-    )
+    response = call_view(url, operator_world.user, method, payload)
     assert response.status_code == 405
 
 
-def test_api_organization_service_can_activate():
+def test_api_organization_service_can_activate(auth_client, operator_world):
     """Test that the can_activate method returns True if the service has no required services."""
-    user = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-    operator = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-
-    organization = factories.OrganizationFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization
-    )
+    client = auth_client(operator_world.user)
+    operator = operator_world.operator
+    organization = operator_world.organization_ok1
 
-    service = factories.ServiceFactory()
+    [service] = create_services({})
     factories.OperatorServiceConfigFactory(operator=operator, service=service)
 
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/services/{service.id}/"
-    )
+    response = client.get(service_url(operator, organization, service))
     assert response.status_code == 200
     content = response.json()
     assert content["can_activate"] is True
 
 
-def test_api_organization_service_cannot_activate_required_services():
+def test_api_organization_service_cannot_activate_required_services(
+    auth_client, operator_world
+):
     """Test that it is not possible to activate a service if one of its required services is not activated."""
-    user = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-    operator = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-
-    organization = factories.OrganizationFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization
-    )
+    client = auth_client(operator_world.user)
+    operator = operator_world.operator
+    organization = operator_world.organization_ok1
 
-    service_required = factories.ServiceFactory(name="Service Required")
+    service_required, service = create_services(
+        {"name": "Service Required"}, {"name": "Service"}
+    )
     factories.OperatorServiceConfigFactory(operator=operator, service=service_required)
-
-    service = factories.ServiceFactory(name="Service")
     service.required_services.add(service_required)
     factories.OperatorServiceConfigFactory(operator=operator, service=service)
 
     # Check that the service cannot be activated by default
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/services/{service.id}/"
-    )
+    response = client.get(service_url(operator, organization, service))
     assert response.status_code == 200
     content = response.json()
     assert content["can_activate"] is False
 
     # Check that the subscription cannot be created
     response = client.patch(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/services/{service.id}/subscription/",
+        subscription_url(operator, organization, service),
         {"is_active": True},
         format="json",
     )
@@ -551,37 +434,32 @@ def test_api_organization_service_cannot_activate_required_services():
     assert "missing_required_services" in response.json()["__all__"][0].lower()
 
 
-def test_api_organization_service_can_update_subscription_when_cannot_activate():
+def test_api_organization_service_can_update_subscription_when_cannot_activate(
+    auth_client,
+    operator_world,
+):
     """Test that it is possible to update a subscription (with is_active=False only) when it cannot be activated."""
-    user = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-    operator = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-
-    organization = factories.OrganizationFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization
-    )
+    client = auth_client(operator_world.user)
+    operator = operator_world.operator
+    organization = operator_world.organization_ok1
 
-    service_required = factories.ServiceFactory(name="Service Required")
+    service_required, service = create_services(
+        {"name": "Service Required"}, {"name": "Service"}
+    )
     factories.OperatorServiceConfigFactory(operator=operator, service=service_required)
-
-    service = factories.ServiceFactory(name="Service")
     service.required_services.add(service_required)
     factories.OperatorServiceConfigFactory(operator=operator, service=service)
 
     # Check that the service cannot be activated by default
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/services/{service.id}/"
-    )
+    response = client.get(service_url(operator, organization, service))
     assert response.status_code == 200
     content = response.json()
     assert content["can_activate"] is False
 
     # Check that the subscription can be created if is_active is False
+    url = subscription_url(operator, organization, service)
     response = client.patch(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/services/{service.id}/subscription/",
+        url,
         {"metadata": {"idp_id": "1234567890"}, "is_active": False},
         format="json",
     )
@@ -589,42 +467,33 @@ def test_api_organization_service_can_update_subscription_when_cannot_activate()
 
     # Check that the subscription can be updated if is_active is False
     response = client.patch(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/services/{service.id}/subscription/",
+        url,
         {"metadata": {"idp_id": "1234567891"}},
         format="json",
     )
     assert response.status_code == 200
 
 
-def test_api_organization_service_can_activate_if_required_services_are_activated():
+def test_api_organization_service_can_activate_if_required_services_are_activated(
+    auth_client,
+    operator_world,
+):
     """Test that activation of a service is possible if all its required services gets activated."""
-    user = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-    operator = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-
-    organization = factories.OrganizationFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization
-    )
+    client = auth_client(operator_world.user)
+    operator = operator_world.operator
+    organization = operator_world.organization_ok1
+    organization2 = operator_world.organization_ok2
 
-    organization2 = factories.OrganizationFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization2
+    service_required, service = create_services(
+        {"name": "Service Required"}, {"name": "Service"}
     )
-
-    service_required = factories.ServiceFactory(name="Service Required")
     factories.OperatorServiceConfigFactory(operator=operator, service=service_required)
-
-    service = factories.ServiceFactory(name="Service")
     service.required_services.add(service_required)
     factories.OperatorServiceConfigFactory(operator=operator, service=service)
 
     # Check that the service cannot be activated by default
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/services/{service.id}/"
-    )
+    detail_url = service_url(operator, organization, service)
+    response = client.get(detail_url)
     assert response.status_code == 200
     content = response.json()
     assert content["can_activate"] is False
@@ -636,9 +505,7 @@ def test_api_organization_service_can_activate_if_required_services_are_activate
         organization=organization2, service=service_required, operator=operator
     )
 
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/services/{service.id}/"
-    )
+    response = client.get(detail_url)
     assert response.status_code == 200
     content = response.json()
     assert content["can_activate"] is False
@@ -650,40 +517,32 @@ def test_api_organization_service_can_activate_if_required_services_are_activate
     )
 
     # Check that the service can be activated
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/services/{service.id}/"
-    )
+    response = client.get(detail_url)
     assert response.status_code == 200
     content = response.json()
     assert content["can_activate"] is True
 
 
-def test_api_services_exposed_config_only_whitelisted_keys():
+def test_api_services_exposed_config_only_whitelisted_keys(auth_client, operator_world):
     """Only whitelisted keys are exposed; secrets and internal keys are stripped."""
-    user = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-
-    operator = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-
-    organization = factories.OrganizationFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization
-    )
-
-    service = factories.ServiceFactory(
-        config={
-            # Whitelisted keys
-            "help_center_url": "https://help.example.fr",
-            "population_limits": {"commune": 3500, "epci": 15000},
-            "auto_admin_population_threshold": 5000,
-            "idp_id": "my-idp",
-            # Non-whitelisted keys (must NOT appear)
-            "secret_key": "secret",
-            "metrics_auth_token": "tok_secret",
-            "webhooks": [{"url": "https://internal.hook"}],
-            "entitlements_api_key": "eak_secret",
+    client = auth_client(operator_world.user)
+    operator = operator_world.operator
+    organization = operator_world.organization_ok1
+
+    [service] = create_services(
+        {
+            "config": {
+                # Whitelisted keys
+                "help_center_url": "https://help.example.fr",
+                "population_limits": {"commune": 3500, "epci": 15000},
+                "auto_admin_population_threshold": 5000,
+                "idp_id": "my-idp",
+                # Non-whitelisted keys (must NOT appear)
+                "secret_key": "secret",
+                "metrics_auth_token": "tok_secret",
+                "webhooks": [{"url": "https://internal.hook"}],
+                "entitlements_api_key": "eak_secret",
+            }
         }
     )
     factories.OperatorServiceConfigFactory(operator=operator, service=service)
@@ -696,42 +555,34 @@ def test_api_services_exposed_config_only_whitelisted_keys():
     }
 
     # List route
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/services/"
-    )
+    response = client.get(services_url(operator, organization))
     assert response.status_code == 200
     config = response.json()["results"][0]["config"]
     assert config == expected_config
 
     # Retrieve route
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/services/{service.id}/"
-    )
+    response = client.get(service_url(operator, organization, service))
     assert response.status_code == 200
     config = response.json()["config"]
     assert config == expected_config
 
 
-def test_api_services_exposed_config_with_operator_override():
+def test_api_services_exposed_config_with_operator_override(
+    auth_client, operator_world
+):
     """config_override merges into whitelisted output but is not itself exposed."""
-    user = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-
-    operator = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-
-    organization = factories.OrganizationFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization
-    )
-
-    service = factories.ServiceFactory(
-        config={
-            "help_center_url": "https://base.example.fr",
-            "population_limits": {"commune": 3500, "epci": 15000},
-            "idp_id": "base-idp",
-            "metrics_auth_token": "base_secret",
+    client = auth_client(operator_world.user)
+    operator = operator_world.operator
+    organization = operator_world.organization_ok1
+
+    [service] = create_services(
+        {
+            "config": {
+                "help_center_url": "https://base.example.fr",
+                "population_limits": {"commune": 3500, "epci": 15000},
+                "idp_id": "base-idp",
+                "metrics_auth_token": "base_secret",
+            }
         }
     )
     factories.OperatorServiceConfigFactory(
@@ -756,9 +607,7 @@ def test_api_services_exposed_config_with_operator_override():
         "auto_admin_population_threshold": 9999,
     }
 
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/services/{service.id}/"
-    )
+    response = client.get(service_url(operator, organization, service))
     assert response.status_code == 200
     data = response.json()
 
@@ -770,208 +619,151 @@ def test_api_services_exposed_config_with_operator_override():
     assert "config_override" not in (data.get("operator_config") or {})
 
 
-def test_api_services_exposed_config_empty():
-    """When service has no whitelisted keys, config is an empty dict."""
-    user = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-
-    operator = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-
-    organization = factories.OrganizationFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization
-    )
-
-    service = factories.ServiceFactory(
-        config={"metrics_auth_token": "secret", "webhooks": []}
-    )
-    factories.OperatorServiceConfigFactory(operator=operator, service=service)
+def test_api_services_exposed_config_ignores_other_operator_override(
+    auth_client, operator_world
+):
+    """Another operator's config_override should never leak into the config."""
+    client = auth_client(operator_world.user)
+    operator = operator_world.operator
+    organization = operator_world.organization_ok1
 
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/services/{service.id}/"
+    [service] = create_services(
+        {"config": {"help_center_url": "https://base.example.fr"}}
     )
-    assert response.status_code == 200
-    assert response.json()["config"] == {}
-
-
-@pytest.mark.parametrize(
-    "population,epci_population,expected_can_activate,expected_reason,_description",
-    [
-        (3000, 20000, True, None, "commune population below limit"),
-        (5000, 10000, True, None, "EPCI population below limit"),
-        (
-            5000,
-            20000,
-            False,
-            "population_limit_exceeded",
-            "both populations exceed limits",
-        ),
-        (None, None, False, "population_limit_exceeded", "both populations are null"),
-    ],
-)
-def test_api_organization_service_commune_population_limits(
-    population, epci_population, expected_can_activate, expected_reason, _description
-):
-    """Test population limit checking for commune organizations."""
-    user = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-    operator = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-
-    organization = factories.OrganizationFactory(
-        type="commune", population=population, epci_population=epci_population
+    factories.OperatorServiceConfigFactory(
+        operator=operator_world.operator2,
+        service=service,
+        config_override={"help_center_url": "https://other.example.fr"},
     )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization
+    factories.OperatorServiceConfigFactory(
+        operator=operator,
+        service=service,
+        config_override={"help_center_url": "https://override.example.fr"},
     )
+    expected_config = {"help_center_url": "https://override.example.fr"}
 
-    service = factories.ServiceFactory(
-        config={"population_limits": {"commune": 3500, "epci": 15000}}
-    )
-    factories.OperatorServiceConfigFactory(operator=operator, service=service)
+    response = client.get(service_url(operator, organization, service))
+    assert response.status_code == 200
+    assert response.json()["config"] == expected_config
 
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/services/{service.id}/"
+    # Without the viewset prefetch, the config is looked up for the operator.
+    serializer = OrganizationServiceSerializer(
+        service, context={"organization": organization, "operator": operator}
     )
-    assert response.status_code == 200
-    content = response.json()
-    assert content["can_activate"] is expected_can_activate
-    if expected_reason:
-        assert content["activation_blocked_reason"] == expected_reason
-    else:
-        assert "activation_blocked_reason" not in content
+    assert serializer.data["config"] == expected_config
 
 
-@pytest.mark.parametrize(
-    "population,expected_can_activate,expected_reason,_description",
-    [
-        (10000, True, None, "EPCI population below limit"),
-        (20000, False, "population_limit_exceeded", "EPCI population above limit"),
-        (None, False, "population_limit_exceeded", "EPCI population is null"),
-    ],
-)
-def test_api_organization_service_epci_population_limits(
-    population, expected_can_activate, expected_reason, _description
-):
-    """Test population limit checking for EPCI organizations."""
-    user = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-    operator = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-
-    organization = factories.OrganizationFactory(type="epci", population=population)
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization
-    )
+def test_api_services_exposed_config_empty(auth_client, operator_world):
+    """When service has no whitelisted keys, config is an empty dict."""
+    client = auth_client(operator_world.user)
+    operator = operator_world.operator
+    organization = operator_world.organization_ok1
 
-    service = factories.ServiceFactory(
-        config={"population_limits": {"commune": 3500, "epci": 15000}}
+    [service] = create_services(
+        {"config": {"metrics_auth_token": "secret", "webhooks": []}}
     )
     factories.OperatorServiceConfigFactory(operator=operator, service=service)
 
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/services/{service.id}/"
-    )
+    response = client.get(service_url(operator, organization, service))
     assert response.status_code == 200
-    content = response.json()
-    assert content["can_activate"] is expected_can_activate
-    if expected_reason:
-        assert content["activation_blocked_reason"] == expected_reason
-    else:
-        assert "activation_blocked_reason" not in content
+    assert response.json()["config"] == {}
+
+
+@pytest.fixture(name="population_limits_setup", scope="module")
+def fixture_population_limits_setup(module_db):
+    """
+    Create, once for the whole module, a user with a role on an operator that
+    offers a service limited to communes of 3500 and EPCIs of 15000 inhabitants.
+    """
+    with module_db():
+        user = factories.UserFactory()
+        operator = factories.OperatorFactory()
+        factories.UserOperatorRoleFactory(user=user, operator=operator)
+        service = factories.ServiceFactory(
+            config={"population_limits": {"commune": 3500, "epci": 15000}}
+        )
+        factories.OperatorServiceConfigFactory(operator=operator, service=service)
+        yield user, operator, service
 
 
 @pytest.mark.parametrize(
-    "can_bypass,org_type,population,epci_population,expected_can_activate,_description",
+    "org_type,population,epci_population,can_bypass,expected_reason",
     [
-        (
-            True,
-            "commune",
-            5000,
-            20000,
-            True,
-            "operator bypass with commune exceeding limits",
-        ),
-        (True, "epci", 20000, None, True, "operator bypass with EPCI exceeding limit"),
-        (
-            False,
-            "commune",
-            5000,
-            20000,
-            False,
-            "no bypass with commune exceeding limits",
-        ),
-        (False, "epci", 20000, None, False, "no bypass with EPCI exceeding limit"),
+        ("commune", 3000, 20000, False, None),
+        ("commune", 5000, 10000, False, None),
+        ("commune", 5000, 20000, False, "population_limit_exceeded"),
+        ("commune", None, None, False, "population_limit_exceeded"),
+        ("epci", 10000, None, False, None),
+        ("epci", 20000, None, False, "population_limit_exceeded"),
+        ("epci", None, None, False, "population_limit_exceeded"),
+        ("commune", 5000, 20000, True, None),
+        ("epci", 20000, None, True, None),
+    ],
+    ids=[
+        "commune-population-below-limit",
+        "commune-epci-population-below-limit",
+        "commune-both-populations-above-limits",
+        "commune-both-populations-null",
+        "epci-population-below-limit",
+        "epci-population-above-limit",
+        "epci-population-null",
+        "commune-above-limits-operator-bypass",
+        "epci-above-limit-operator-bypass",
     ],
 )
-def test_api_organization_service_operator_bypass_population_limits(
-    can_bypass,
+def test_api_organization_service_population_limits(
+    auth_client,
+    population_limits_setup,
     org_type,
     population,
     epci_population,
-    expected_can_activate,
-    _description,
+    can_bypass,
+    expected_reason,
 ):
-    """Test operator bypass functionality for population limits."""
-    user = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-    operator_config = {"can_bypass_population_limits": can_bypass} if can_bypass else {}
-    operator = factories.OperatorFactory(config=operator_config)
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-
-    org_kwargs = {"type": org_type, "population": population}
-    if org_type == "commune":
-        org_kwargs["epci_population"] = epci_population
-    organization = factories.OrganizationFactory(**org_kwargs)
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization
-    )
-
-    service = factories.ServiceFactory(
-        config={"population_limits": {"commune": 3500, "epci": 15000}}
+    """
+    A service with population limits can only be activated for communes or EPCIs
+    below these limits, unless the operator is allowed to bypass them.
+    """
+    user, operator, service = population_limits_setup
+    if can_bypass:
+        models.Operator.objects.filter(pk=operator.pk).update(
+            config={"can_bypass_population_limits": True}
+        )
+
+    [organization] = create_operator_organizations(
+        operator,
+        {
+            "type": org_type,
+            "population": population,
+            "epci_population": epci_population,
+        },
     )
-    factories.OperatorServiceConfigFactory(operator=operator, service=service)
 
-    response = client.get(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/services/{service.id}/"
-    )
+    client = auth_client(user)
+    response = client.get(service_url(operator, organization, service))
     assert response.status_code == 200
     content = response.json()
-    assert content["can_activate"] is expected_can_activate
-    if expected_can_activate:
-        assert "activation_blocked_reason" not in content
+    assert content["can_activate"] is (expected_reason is None)
+    if expected_reason:
+        assert content["activation_blocked_reason"] == expected_reason
     else:
-        assert content["activation_blocked_reason"] == "population_limit_exceeded"
+        assert "activation_blocked_reason" not in content
 
 
-def test_api_organization_service_subscription_validation_population_limits():
+def test_api_organization_service_subscription_validation_population_limits(
+    auth_client, population_limits_setup
+):
     """Test that subscription activation is blocked when population limits are exceeded."""
-    user = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-    operator = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator)
-
-    organization = factories.OrganizationFactory(
-        type="commune", population=5000, epci_population=20000
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator, organization=organization
-    )
+    user, operator, service = population_limits_setup
+    client = auth_client(user)
 
-    service = factories.ServiceFactory(
-        config={"population_limits": {"commune": 3500, "epci": 15000}}
+    [organization] = create_operator_organizations(
+        operator, {"type": "commune", "population": 5000, "epci_population": 20000}
     )
-    factories.OperatorServiceConfigFactory(operator=operator, service=service)
 
     # Try to activate subscription
     response = client.patch(
-        f"/api/v1.0/operators/{operator.id}/organizations/{organization.id}/services/{service.id}/subscription/",
+        subscription_url(operator, organization, service),
         {"is_active": True},
         format="json",
     )
@@ -979,182 +771,131 @@ def test_api_organization_service_subscription_validation_population_limits():
     assert "population_limit_exceeded" in response.json()["__all__"][0].lower()
 
 
-def test_api_organizations_services_list_includes_other_operator_subscription():
-    """
-    Services list should return the effective subscription (from any operator)
-    in the subscription field, with operator_id and operator_name identifying
-    who manages it.
+@pytest.fixture(name="two_operator_organization", scope="module")
+def fixture_two_operator_organization(module_db):
     """
-    user = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-
-    operator1 = factories.OperatorFactory(name="Operator 1")
-    operator2 = factories.OperatorFactory(name="Operator 2", config={"idps": []})
-    factories.UserOperatorRoleFactory(user=user, operator=operator1)
-
-    organization = factories.OrganizationFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator1, organization=organization
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator2, organization=organization
-    )
-
-    service = factories.ServiceFactory()
-    factories.OperatorServiceConfigFactory(operator=operator1, service=service)
-    factories.OperatorServiceConfigFactory(operator=operator2, service=service)
-
-    # Create subscription from operator2 (not current operator)
-    factories.ServiceSubscriptionFactory(
-        organization=organization, service=service, operator=operator2, is_active=True
-    )
-
-    response = client.get(
-        f"/api/v1.0/operators/{operator1.id}/organizations/{organization.id}/services/"
-    )
-    assert response.status_code == 200
-    content = response.json()
-    results = content["results"]
+    Create, once for the whole module, an organization managed by two operators, a
+    user with a role on the first one, and a service configured for the second one.
 
-    service_result = next(r for r in results if r["id"] == service.id)
-
-    # Subscription should now contain the effective subscription (from operator2)
-    # with operator info to identify who manages it
-    subscription = service_result["subscription"]
-    assert subscription is not None
-    assert subscription["operator_id"] == str(operator2.id)
-    assert subscription["operator_name"] == "Operator 2"
-    assert subscription["is_active"] is True
-    assert "created_at" in subscription
+    Yield the user, the two operators, the organization and the service.
+    """
+    with module_db():
+        user = models.User.objects.bulk_create([factories.UserFactory.build()])[0]
+        operator1, operator2 = models.Operator.objects.bulk_create(
+            [
+                factories.OperatorFactory.build(name=name, config={"idps": []})
+                for name in ["Operator 1", "Operator 2"]
+            ]
+        )
+        factories.UserOperatorRoleFactory(user=user, operator=operator1)
+        [organization] = create_operator_organizations(operator1, {})
+        models.OperatorOrganizationRole.objects.bulk_create(
+            [
+                factories.OperatorOrganizationRoleFactory.build(
+                    operator=operator2, organization=organization
+                )
+            ]
+        )
+        [service] = create_services({})
+        models.OperatorServiceConfig.objects.bulk_create(
+            [
+                factories.OperatorServiceConfigFactory.build(
+                    operator=operator2, service=service
+                )
+            ]
+        )
+
+        yield user, operator1, operator2, organization, service
 
 
-def test_api_organizations_services_shows_service_with_only_other_operator_subscription():
+@pytest.mark.parametrize(
+    "current_operator_has_config,subscribing_operator",
+    [
+        (True, "operator2"),
+        (False, "operator2"),
+        (True, "operator1"),
+        (True, None),
+        (False, None),
+    ],
+    ids=[
+        "other-operator-subscription",
+        "only-other-operator-subscription",
+        "current-operator-subscription",
+        "config-without-subscription",
+        "neither-config-nor-subscription",
+    ],
+)
+def test_api_organizations_services_list_effective_subscription(
+    auth_client,
+    two_operator_organization,
+    django_assert_max_num_queries,
+    current_operator_has_config,
+    subscribing_operator,
+):
     """
+    Services list should return the effective subscription (from any operator)
+    in the subscription field, with operator_id and operator_name identifying
+    who manages it.
+
     Services that only have a subscription from another operator (not current)
-    should still appear in the list for visibility. The subscription field
-    returns the effective subscription with operator info.
+    should still appear in the list for visibility, while services with neither
+    a config for the current operator nor a subscription should not.
     """
-    user = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-
-    operator1 = factories.OperatorFactory(name="Operator 1")
-    operator2 = factories.OperatorFactory(name="Operator 2", config={"idps": []})
-    factories.UserOperatorRoleFactory(user=user, operator=operator1)
-
-    organization = factories.OrganizationFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator1, organization=organization
-    )
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator2, organization=organization
-    )
-
-    # Service with NO config for operator1
-    service = factories.ServiceFactory()
-    factories.OperatorServiceConfigFactory(operator=operator2, service=service)
-
-    # Before creating the subscription, the service should NOT appear
-    response = client.get(
-        f"/api/v1.0/operators/{operator1.id}/organizations/{organization.id}/services/"
-    )
+    user, operator1, operator2, organization, service = two_operator_organization
+    operators = {"operator1": operator1, "operator2": operator2}
+
+    if current_operator_has_config:
+        factories.OperatorServiceConfigFactory(operator=operator1, service=service)
+    if subscribing_operator:
+        factories.ServiceSubscriptionFactory(
+            organization=organization,
+            service=service,
+            operator=operators[subscribing_operator],
+            is_active=True,
+        )
+
+    # The entitlements of the subscriptions, whoever their operator, are prefetched
+    with django_assert_max_num_queries(10):
+        response = auth_client(user).get(services_url(operator1, organization))
     assert response.status_code == 200
-    service_ids_before = [r["id"] for r in response.json()["results"]]
-    assert service.id not in service_ids_before
+    results_by_id = {result["id"]: result for result in response.json()["results"]}
 
-    # Now create subscription from operator2
-    factories.ServiceSubscriptionFactory(
-        organization=organization, service=service, operator=operator2
-    )
+    if not current_operator_has_config and not subscribing_operator:
+        assert service.id not in results_by_id
+        return
 
-    response = client.get(
-        f"/api/v1.0/operators/{operator1.id}/organizations/{organization.id}/services/"
+    service_result = results_by_id[service.id]
+    assert (service_result["operator_config"] is not None) is (
+        current_operator_has_config
     )
-    assert response.status_code == 200
-    content = response.json()
 
-    # Service should appear even though current operator has no config/subscription
-    service_ids = [r["id"] for r in content["results"]]
-    assert service.id in service_ids
-
-    service_result = next(r for r in content["results"] if r["id"] == service.id)
-
-    # Subscription shows the effective subscription (from operator2) with operator info
     subscription = service_result["subscription"]
-    assert subscription is not None
-    assert subscription["operator_id"] == str(operator2.id)
-    assert subscription["operator_name"] == "Operator 2"
+    if not subscribing_operator:
+        assert subscription is None
+        return
 
-    assert service_result["operator_config"] is None  # No config for current operator
+    expected_operator = operators[subscribing_operator]
+    assert subscription["operator_id"] == str(expected_operator.id)
+    assert subscription["operator_name"] == expected_operator.name
+    assert subscription["is_active"] is True
+    assert "created_at" in subscription
 
 
-def test_api_organizations_services_permission():
+def test_api_organizations_services_permission(operator_world):
     """
     Verify that services are only visible when current operator manages the organization.
     """
-    user = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-
-    operator1 = factories.OperatorFactory()
-    operator2 = factories.OperatorFactory()
-    factories.UserOperatorRoleFactory(user=user, operator=operator1)
+    operator1 = operator_world.operator
+    operator2 = operator_world.operator2
 
     # Organization NOT managed by operator1
-    organization = factories.OrganizationFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator2, organization=organization
-    )
+    organization = operator_world.organization_nok1
 
-    service = factories.ServiceFactory()
+    [service] = create_services({})
     factories.ServiceSubscriptionFactory(
         organization=organization, service=service, operator=operator2
     )
 
     # Should get 403 because operator1 doesn't manage this org
-    response = client.get(
-        f"/api/v1.0/operators/{operator1.id}/organizations/{organization.id}/services/"
-    )
+    response = call_view(services_url(operator1, organization), operator_world.user)
     assert response.status_code == 403
-
-
-def test_api_organizations_services_subscription_includes_operator_info():
-    """
-    Verify that when the current operator has a subscription, it includes operator info.
-    """
-    user = factories.UserFactory()
-    client = APIClient()
-    client.force_login(user)
-
-    operator1 = factories.OperatorFactory(name="Operator 1", config={"idps": []})
-    factories.UserOperatorRoleFactory(user=user, operator=operator1)
-
-    organization = factories.OrganizationFactory()
-    factories.OperatorOrganizationRoleFactory(
-        operator=operator1, organization=organization
-    )
-
-    service = factories.ServiceFactory()
-    factories.OperatorServiceConfigFactory(operator=operator1, service=service)
-
-    # Create subscription from operator1 (current operator)
-    factories.ServiceSubscriptionFactory(
-        organization=organization, service=service, operator=operator1, is_active=True
-    )
-
-    response = client.get(
-        f"/api/v1.0/operators/{operator1.id}/organizations/{organization.id}/services/"
-    )
-    assert response.status_code == 200
-    content = response.json()
-    results = content["results"]
-
-    service_result = next(r for r in results if r["id"] == service.id)
-
-    # Current operator's subscription should be in "subscription" field with operator info
-    subscription = service_result["subscription"]
-    assert subscription is not None
-    assert subscription["is_active"] is True
-    assert subscription["operator_id"] == str(operator1.id)
-    assert subscription["operator_name"] == "Operator 1"
@@ -2,6 +2,8 @@
 
 from unittest import mock
 
+from django.core.cache import cache
+
 import pytest
 
 USER = "user"
@@ -9,6 +11,12 @@ TEAM = "team"
 VIA = [USER, TEAM]
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start each test with an empty cache, e.g. no failed organization lookups."""
+    cache.clear()
+
+
 @pytest.fixture
 def mock_user_teams():
     """Mock for the "teams" property on the User model."""
@@ -0,0 +1,53 @@
+"""
+Unit tests for the database indexes of the Organization model
+"""
+
+from django.db import connection
+
+import pytest
+
+from core.models import Organization
+
+pytestmark = pytest.mark.django_db
+
+
+class TestOrganizationIndexes:
+    """Test the indexes backing organization lookups and search."""
+
+    @pytest.mark.parametrize("column", ["siret", "siren", "code_insee"])
+    def test_identifier_columns_are_indexed(self, column):
+        """Identifier columns used for organization lookups should be indexed."""
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, Organization._meta.db_table
+            )
+        assert any(
+            constraint["index"] and constraint["columns"] == [column]
+            for constraint in constraints.values()
+        )
+
+    @pytest.mark.parametrize(
+        "column,index_name",
+        [
+            ("name", "idx_organization_name_gin_trgm"),
+            ("departement_code_insee", "idx_organization_departement_gin_trgm"),
+            ("epci_libelle", "idx_organization_epci_gin_trgm"),
+        ],
+    )
+    def test_search_columns_use_trigram_index(self, column, index_name):
+        """
+        The accent insensitive ILIKE filter of the organization search should be
+        able to use the trigram GIN index of each searched column.
+        """
+        with connection.cursor() as cursor:
+            # The test table is tiny: keep the planner from preferring a
+            # sequential scan so the plan shows whether the index applies.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute(
+                f"EXPLAIN SELECT id FROM {Organization._meta.db_table} "
+                f"WHERE unaccent_immutable({column}) ILIKE unaccent_immutable(%s)",
+                ["%evr%"],
+            )
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+        assert "Bitmap Index Scan" in plan
+        assert index_name in plan
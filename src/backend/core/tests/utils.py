@@ -2,6 +2,9 @@
 
 import json
 
+from core import models
+from core.utils import forget_organizations_not_found
+
 
 def assert_equals_partial(actual, expected, debug=False):
     """Assert that the expected dictionary is a subset of the actual dictionary."""
@@ -12,6 +15,10 @@ def assert_equals_partial(actual, expected, debug=False):
         for i, item in enumerate(actual):
             assert_equals_partial(item, expected[i], debug)
     elif isinstance(actual, dict):
+        # Exactly equal values match as well: check them all at once and only
+        # walk the keys one by one for partial matches and error messages.
+        if not debug and expected.items() <= actual.items():
+            return
         for key, value in expected.items():
             if debug:
                 print(f"Asserting {key}: {value}")  # noqa: T201
@@ -25,3 +32,77 @@ def assert_equals_partial(actual, expected, debug=False):
                 )
     else:
         assert actual == expected, f"Expected {expected} but got {actual}"
+
+
+def assert_items_match(actual, expected):
+    """
+    Assert that each item of the actual list contains the key/values of the
+    expected item at the same position.
+
+    Unlike `assert_equals_partial`, actual items are first reduced to the expected
+    keys so the check is a single list comparison, which also shows the whole
+    diff on failure. Only flat dictionaries are supported.
+    """
+    assert len(actual) == len(expected)
+    assert [
+        {key: item.get(key) for key in expected_item}
+        for item, expected_item in zip(actual, expected, strict=True)
+    ] == expected
+
+
+def expected_operator_dict(operator, user_role="admin", with_role=True):
+    """
+    Return the expected API representation of an operator.
+
+    Only the whitelisted keys of the operator configuration are exposed: they are
+    listed here rather than read from the serializer, so that widening its
+    whitelist makes the tests fail. Null-valued keys are left out. Set `with_role`
+    to False for payloads without the user role and active status, like the
+    entitlements one.
+    """
+    config = operator.config or {}
+    expected = {
+        "id": str(operator.id),
+        "name": operator.name,
+        "siret": operator.siret,
+        "url": operator.url,
+        "config": {
+            key: config[key]
+            for key in ("idps", "support_email")
+            if config.get(key) is not None
+        },
+    }
+    if with_role:
+        expected["is_active"] = operator.is_active
+        expected["user_role"] = user_role
+    return expected
+
+
+# Tests using `create_operator_organizations` only look at a few organization
+# fields: leave the others empty rather than generating fake data for them.
+MINIMAL_ORGANIZATION_KWARGS = {"name": "Organization"}
+
+
+def create_operator_organizations(operator, *organizations_kwargs):
+    """
+    Create one organization per set of field values, all managed by the operator,
+    with a single INSERT per table.
+    """
+    organizations = models.Organization.objects.bulk_create(
+        [
+            models.Organization(
+                **{**MINIMAL_ORGANIZATION_KWARGS, **organization_kwargs}
+            )
+            for organization_kwargs in organizations_kwargs
+        ]
+    )
+    models.OperatorOrganizationRole.objects.bulk_create(
+        [
+            models.OperatorOrganizationRole(
+                operator=operator, organization=organization
+            )
+            for organization in organizations
+        ]
+    )
+    forget_organizations_not_found(organizations)
+    return organizations
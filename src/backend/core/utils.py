@@ -2,6 +2,8 @@
 
 import json
 
+from django.core.cache import cache
+
 from configurations import values
 
 
@@ -18,6 +20,38 @@ class JSONValue(values.Value):
         return json.loads(value)
 
 
+def get_organization_not_found_cache_key(identifier_type, identifier_value):
+    """
+    Return the cache key remembering that no organization matches an identifier.
+
+    Args:
+        identifier_type: One of "siret", "siren" or "insee"
+        identifier_value: The identifier value that was looked up
+    """
+    return f"organization-not-found:{identifier_type}:{identifier_value}"
+
+
+def forget_organizations_not_found(organizations):
+    """
+    Forget the failed identifier lookups matching any of the given organizations.
+
+    Saving an organization does it through a signal, writes skipping signals like
+    `bulk_create` or `update` must call it once they are done.
+    """
+    cache.delete_many(
+        [
+            get_organization_not_found_cache_key(identifier_type, identifier_value)
+            for organization in organizations
+            for identifier_type, identifier_value in (
+                ("siret", organization.siret),
+                ("siren", organization.siren),
+                ("insee", organization.code_insee),
+            )
+            if identifier_value
+        ]
+    )
+
+
 def flat_to_nested(flat_items_list):
     """
     Convert a flat list of items with depth and path information into a nested structure.
@@ -445,6 +445,14 @@ class Base(Configuration):
         None, environ_name="API_PUBLIC_URL", environ_prefix=None
     )
 
+    # Duration (in seconds) during which an organization identifier lookup that
+    # matched nothing is remembered, to avoid hitting the database again
+    ORGANIZATION_NOT_FOUND_CACHE_TIMEOUT = values.IntegerValue(
+        60,
+        environ_name="ORGANIZATION_NOT_FOUND_CACHE_TIMEOUT",
+        environ_prefix=None,
+    )
+
     OPERATOR_CONTRIBUTION_POPULATION_THRESHOLD = values.IntegerValue(
         3500,
         environ_name="OPERATOR_CONTRIBUTION_POPULATION_THRESHOLD",
@@ -601,6 +609,15 @@ class Test(Base):
 
     CELERY_TASK_ALWAYS_EAGER = values.BooleanValue(True)
 
+    # pylint: disable=invalid-name
+    def __init__(self):
+        super().__init__()
+        # The test database is disposable: don't make each commit wait for the
+        # write-ahead log to be flushed to disk.
+        self.DATABASES["default"].setdefault("OPTIONS", {})["options"] = (
+            "-c synchronous_commit=off"
+        )
+
 
 class ContinuousIntegration(Test):
     """